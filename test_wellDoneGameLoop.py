@@ -0,0 +1,169 @@
+"""Tests for wellDoneGameLoop — ใช้นาฬิกาปลอม เรียก tick() เองโดยไม่รอ QTimer
+
+    python -m pytest -q
+"""
+import pytest
+
+QtCore = pytest.importorskip("PySide6.QtCore")
+
+try:
+    from . import wellDoneGameLoop as wdloop
+except Exception:
+    import wellDoneGameLoop as wdloop
+
+STEP = 0.25  # step ที่เป็นเลขฐานสองพอดี เทียบผลรวมได้ตรง ๆ
+MAX_STEPS = 4
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def make_loop(clock, **kwargs):
+    calls = {"simulate": [], "render": 0}
+
+    def simulate(dt):
+        calls["simulate"].append(dt)
+
+    def render():
+        calls["render"] += 1
+
+    loop = wdloop.GameLoop(simulate, render, step=STEP, max_steps=MAX_STEPS, clock=clock, **kwargs)
+    return loop, calls
+
+
+def test_fixed_steps_follow_the_clock(app, clock):
+    loop, calls = make_loop(clock)
+    seconds = []
+    loop.second.connect(lambda: seconds.append(loop.game_time))
+    loop.start()
+
+    clock.now = 0.6
+    loop.tick()
+    assert calls["simulate"] == [STEP, STEP]
+    assert calls["render"] == 1
+    assert loop.accumulator == pytest.approx(0.1)
+
+    # เศษที่ไม่ครบ step ยกไปรอบถัดไป — ไม่ simulate ไม่วาด
+    clock.now = 0.7
+    loop.tick()
+    assert len(calls["simulate"]) == 2 and calls["render"] == 1
+
+    clock.now = 1.0
+    loop.tick()
+    assert calls["simulate"] == [STEP] * 4
+    assert seconds == [1.0]
+    assert loop.stats()["steps"] == 4 and loop.stats()["frames"] == 3
+    loop.stop()
+
+
+def test_catch_up_is_capped_and_the_rest_dropped(app, clock):
+    loop, calls = make_loop(clock)
+    loop.start()
+
+    # ค้างไป 10 วินาที — ตามได้แค่ MAX_STEPS ที่เหลือทิ้ง เชฟไม่วาร์ป
+    clock.now = 10.0
+    loop.tick()
+    assert calls["simulate"] == [STEP] * MAX_STEPS
+    assert calls["render"] == 1
+    assert loop.game_time == MAX_STEPS * STEP
+    assert loop.dropped_seconds == pytest.approx(10.0 - MAX_STEPS * STEP)
+    assert loop.accumulator == 0.0
+
+    # ค้างอีกครั้ง dropped_seconds สะสมต่อ
+    clock.now = 15.0
+    loop.tick()
+    assert loop.steps == 2 * MAX_STEPS
+    assert loop.dropped_seconds == pytest.approx(15.0 - 2 * MAX_STEPS * STEP)
+    loop.stop()
+
+
+def test_paused_time_is_not_simulated(app, clock):
+    loop, calls = make_loop(clock)
+    loop.start()
+    clock.now = 0.5
+    loop.tick()
+    loop.stop()
+
+    clock.now = 60.0
+    loop.start()
+    clock.now = 60.5
+    loop.tick()
+    assert calls["simulate"] == [STEP] * 4
+    assert loop.dropped_seconds == 0.0
+    loop.stop()
+
+
+def test_idle_loop_sleeps_and_simulates_the_gap_once(app, clock):
+    idle, deadline = [True], [None]
+    loop, calls = make_loop(clock, is_idle=lambda: idle[0], next_deadline=lambda: deadline[0])
+    loop.start()
+    # ไม่มีอะไรขยับ — หลับจนถึงวินาทีถัดไปของนาฬิกาเกม
+    assert loop.sleeping and loop._sleep_for == 1.0
+
+    clock.now = 0.7
+    loop.tick()
+    assert calls["simulate"] == [0.7] and calls["render"] == 1
+    assert loop.sleeping and loop._sleep_for == pytest.approx(0.3)
+
+    # งานที่ใกล้ถึง deadline ปลุกเร็วกว่าวินาทีถัดไป
+    deadline[0] = 0.1
+    clock.now = 1.0
+    loop.tick()
+    assert loop._sleep_for == pytest.approx(0.1)
+    assert loop.stats()["sleeps"] == 3
+    assert loop.dropped_seconds == 0.0
+    loop.stop()
+
+
+def test_long_stall_while_asleep_is_capped(app, clock):
+    loop, calls = make_loop(clock, is_idle=lambda: True)
+    loop.start()
+
+    # Maya ค้าง 100 วินาทีระหว่างหลับ — เดินได้ไม่เกินเวลาที่ตั้งใจหลับ + max_steps
+    clock.now = 100.0
+    loop.tick()
+    limit = 1.0 + MAX_STEPS * STEP
+    assert calls["simulate"] == [limit]
+    assert loop.game_time == limit
+    assert loop.dropped_seconds == pytest.approx(100.0 - limit)
+    loop.stop()
+
+
+def test_wake_runs_the_slept_time_then_ticks_every_step(app, clock):
+    idle = [True]
+    loop, calls = make_loop(clock, is_idle=lambda: idle[0])
+    loop.start()
+
+    clock.now = 0.4
+    idle[0] = False
+    loop.wake()
+    assert calls["simulate"] == [0.4]
+    assert not loop.sleeping
+    assert loop._timer.interval() == int(STEP * 1000)
+
+    clock.now = 0.9
+    loop.tick()
+    assert calls["simulate"] == [0.4, STEP, STEP]
+    loop.stop()
+
+
+def test_unfocused_loop_ticks_less_often(app, clock):
+    loop, _ = make_loop(clock, is_throttled=lambda: True, throttle_ms=100)
+    loop.start()
+    assert loop._timer.interval() == 100
+    loop.stop()
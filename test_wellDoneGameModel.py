@@ -0,0 +1,280 @@
+"""Headless tests for wellDoneGameModel — ไม่ต้องมี Qt
+
+    python -m pytest -q
+"""
+import random
+
+import pytest
+
+try:
+    from . import wellDoneGameModel as wdmodel
+except Exception:
+    import wellDoneGameModel as wdmodel
+
+
+@pytest.fixture
+def kitchen():
+    kitchen = wdmodel.Kitchen(seed=1)
+    wdmodel.build_level(kitchen)
+    kitchen.reset()
+    return kitchen
+
+
+def walk_to(kitchen, entity):
+    """วางเชฟให้จุดศูนย์กลางตรงกับ entity"""
+    chef = kitchen.chef
+    cx, cy = entity.center()
+    chef.x, chef.y = cx - chef.w / 2, cy - chef.h / 2
+    kitchen.mark_dirty(chef)
+
+
+def press(kitchen, slot):
+    """(action, เป้าหมาย) ของปุ่ม slot แบบที่ GameWidget.keyPressEvent ได้จาก resolve()"""
+    return kitchen.resolve().action(slot)
+
+
+def hold(kitchen, name):
+    walk_to(kitchen, next(i for i in kitchen.ingredients if i.name == name))
+    action, target = press(kitchen, "use")
+    assert action == "pick_item"
+    assert kitchen.pick_item(target=target) == ("ingredient", name)
+
+
+def test_chop_plate_serve_round(kitchen):
+    hold(kitchen, "tomato")
+    board = kitchen.station("chopping_board")
+    walk_to(kitchen, board)
+    action, target = press(kitchen, "use")
+    assert (action, target) == ("drop_item", board)
+    assert kitchen.drop_item(target) == ("board", "tomato", False)
+
+    item = board.contents[0]
+    action, target = press(kitchen, "chop")
+    assert target is item
+    assert kitchen.start_chop(target=target)[0] == "started"
+    assert kitchen.step(dt=wdmodel.CHOP_SECONDS / 2) == []
+    assert kitchen.step(dt=wdmodel.CHOP_SECONDS / 2) == [("chopped", item)]
+    assert item.name == "tomato_chopped"
+
+    walk_to(kitchen, item)
+    action, target = press(kitchen, "use")
+    assert kitchen.pick_item(target=target) == ("board", "tomato_chopped")
+
+    station = kitchen.station("plate_station")
+    walk_to(kitchen, station)
+    action, target = press(kitchen, "use")
+    assert (action, target) == ("plate_station", station)
+    assert kitchen.item_names(kitchen.add_item_to_station_plate(target)) == ["tomato_chopped"]
+    action, target = press(kitchen, "use")
+    assert kitchen.pickup_plate(target=target) == "station"
+
+    serve = kitchen.station("serve_station")
+    walk_to(kitchen, serve)
+    action, target = press(kitchen, "use")
+    assert (action, target) == ("serve", serve)
+    source, items, points = kitchen.serve_plate(serve=target)
+    assert source == "held"
+    assert kitchen.item_names(items) == ["tomato_chopped"]
+    assert points >= wdmodel.ORDER_POINTS
+    assert kitchen.score == points
+    assert kitchen.chef.plate is None
+    assert len(kitchen.orders) == kitchen.orders.size
+
+
+def test_stale_target_is_queried_again(kitchen):
+    tomato = kitchen.ingredients[0]
+    walk_to(kitchen, tomato)
+    # เป้าหมายที่ไกลเกินระยะแล้ว -> model หาของที่อยู่ใกล้เอง
+    far = kitchen.station("serve_station")
+    assert kitchen.pick_item(target=far) == ("ingredient", tomato.name)
+
+
+def test_pot_boils_a_full_batch(kitchen):
+    pot = kitchen.station("pot")
+    for n in range(wdmodel.POT_BATCH):
+        hold(kitchen, "lettuce")
+        walk_to(kitchen, pot)
+        where, name, boiling = kitchen.drop_item()
+        assert (where, name) == ("pot", "lettuce")
+        assert boiling == (n == wdmodel.POT_BATCH - 1)
+    assert len(pot.batches) == 1
+
+    (_, heating), (stage, boiling) = wdmodel.BOIL_STAGES
+    events = kitchen.step(dt=heating)
+    assert [event for event, _ in events] == [stage]
+    events = kitchen.step(dt=boiling)
+    assert [event for event, _ in events] == ["boiled"]
+    assert events[0][1].name == "lettuce_boiled"
+    assert not pot.contents and not pot.batches
+
+
+def test_partial_batch_does_not_boil(kitchen):
+    pot = kitchen.station("pot")
+    hold(kitchen, "tomato")
+    walk_to(kitchen, pot)
+    kitchen.drop_item()
+    kitchen.step(dt=sum(seconds for _, seconds in wdmodel.BOIL_STAGES) * 2)
+    assert len(pot.contents) == 1 and not pot.batches
+    assert len(kitchen.jobs) == 0
+
+
+def test_orders_expire_and_are_replaced(kitchen):
+    orders = kitchen.orders
+    first = next(iter(orders))
+    events = kitchen.step(dt=orders.lifetime)
+    expired = [order for event, order in events if event == "order_expired"]
+    assert first in expired
+    assert len(orders) == orders.size
+    assert all(order.open for order in orders)
+
+
+
+def test_same_seed_gives_the_same_orders():
+    def played(seed):
+        kitchen = wdmodel.Kitchen(seed=seed)
+        wdmodel.build_level(kitchen)
+        kitchen.reset()
+        kitchen.step(dt=kitchen.orders.lifetime * 3)
+        return [order.key.ids for order in kitchen.orders]
+
+    assert played(7) == played(7)
+
+def test_scheduler_cancel_and_pause():
+    jobs = wdmodel.JobScheduler()
+    a = jobs.schedule("chop", "board", "a", 1.0)
+    jobs.schedule("chop", "board", "b", 2.0)
+    jobs.schedule("chop", "other", "c", 3.0)
+
+    assert jobs.cancel("a") is a and a.cancelled
+    assert "a" not in jobs
+    assert jobs.cancel("a") is None
+    assert jobs.next_due() == pytest.approx(2.0)
+
+    jobs.pause()
+    assert jobs.next_due() is None
+    assert jobs.advance(5.0) == []
+    jobs.resume()
+
+    assert [job.target for job in jobs.cancel_owner("board")] == ["b"]
+    assert [job.target for job in jobs.advance(3.0)] == ["c"]
+    assert len(jobs) == 0
+
+
+def test_picking_item_off_board_cancels_its_chop(kitchen):
+    hold(kitchen, "cucamber")
+    board = kitchen.station("chopping_board")
+    walk_to(kitchen, board)
+    kitchen.drop_item(board)
+    item = board.contents[0]
+    kitchen.start_chop()
+    assert item in kitchen.jobs
+
+    walk_to(kitchen, item)
+    assert kitchen.pick_item() == ("board", "cucamber")
+    assert item not in kitchen.jobs
+    assert kitchen.step(dt=wdmodel.CHOP_SECONDS) == []
+
+
+# ------------------- SpatialHash -------------------
+KINDS = ("ingredient", "floor_item", "board_item", "pot", "trash_bin")
+
+
+def scatter(count, seed, size=2000):
+    rng = random.Random(seed)
+    return [wdmodel.Entity(rng.choice(KINDS), f"e{i}", rng.uniform(0, size), rng.uniform(0, size),
+                           rng.randint(10, 200), rng.randint(10, 200))
+            for i in range(count)]
+
+
+def brute_force(entities, x, y, radius=None, kinds=None):
+    found = []
+    for e in entities:
+        if kinds is not None and e.kind not in kinds:
+            continue
+        ex, ey = e.center()
+        d2 = (ex - x) ** 2 + (ey - y) ** 2
+        if radius is None or d2 <= radius * radius:
+            found.append((d2, e))
+    found.sort(key=lambda pair: pair[0])
+    return found
+
+
+def distances(found):
+    return [d2 for d2, _ in found]
+
+
+def test_spatial_hash_query_matches_brute_force():
+    entities = scatter(300, seed=2)
+    index = wdmodel.SpatialHash()
+    for e in entities:
+        index.insert(e)
+    rng = random.Random(5)
+    for _ in range(200):
+        x, y = rng.uniform(-200, 2200), rng.uniform(-200, 2200)
+        radius = rng.choice((10, 50, 120, 400, 5000))
+        kinds = rng.choice((None, ("pot",), ("ingredient", "board_item")))
+        found = index.query(x, y, radius, kinds)
+        expected = brute_force(entities, x, y, radius, kinds)
+        assert distances(found) == distances(expected)
+        assert {id(e) for _, e in found} == {id(e) for _, e in expected}
+
+
+def test_spatial_hash_nearest_reaches_past_occupied_cells():
+    entities = scatter(40, seed=3, size=300)
+    index = wdmodel.SpatialHash()
+    for e in entities:
+        index.insert(e)
+    # จุดที่อยู่ไกลจากทุกช่องที่มีของ — ต้องขยายวงจนเจอ ไม่ใช่คืนลิสต์ว่าง
+    for x, y in ((5000, 5000), (-3000, 150), (150, 150)):
+        for k in (1, 3, 40, 100):
+            found = index.nearest(x, y, k=k)
+            assert distances(found) == distances(brute_force(entities, x, y))[:k]
+    assert distances(index.nearest(5000, 5000, k=2, kinds=("pot",))) == \
+        distances(brute_force(entities, 5000, 5000, kinds=("pot",)))[:2]
+
+
+def test_spatial_hash_move_and_remove():
+    index = wdmodel.SpatialHash()
+    e = wdmodel.Entity("pot", "pot", 0, 0, 20, 20)
+    index.insert(e)
+    e.x, e.y = 1000, 1000
+    index.move(e)
+    assert index.query(10, 10, 50) == []
+    assert index.query(1010, 1010, 5)[0][1] is e
+    index.remove(e)
+    assert e not in index and not index.cells
+
+
+def gap2(entity, x, y, half_w, half_h):
+    cx, cy = entity.center()
+    gx = max(abs(cx - x) - entity.w / 2 - half_w, 0)
+    gy = max(abs(cy - y) - entity.h / 2 - half_h, 0)
+    return gx * gx + gy * gy
+
+
+def test_nearest_per_kind_agrees_with_full_scan():
+    entities = scatter(300, seed=4)
+    index = wdmodel.SpatialHash()
+    for e in entities:
+        index.insert(e)
+    rng = random.Random(6)
+    for _ in range(300):
+        x, y = rng.uniform(-100, 2100), rng.uniform(-100, 2100)
+        half_w, half_h = rng.choice(((0.0, 0.0), (40.0, 60.0)))
+        radius = rng.choice((30, 80, 150))
+        near = index.nearest_per_kind(x, y, radius, half_w, half_h)
+        for kind in KINDS:
+            scan = brute_force(entities, x, y, kinds=(kind,))
+            d2, closest = scan[0]
+            if kind in near:
+                # ชิ้นใกล้สุดตามจุดศูนย์กลาง — เท่ากันได้หลายชิ้น เลยเทียบที่ระยะ
+                assert near[kind][0] == d2
+                assert near[kind][1] == gap2(near[kind][2], x, y, half_w, half_h)
+                closest = near[kind][2]
+            else:
+                # ไม่อยู่ในผล = ไม่มีชิ้นไหนของ kind นี้อยู่ในระยะเลย ไม่ว่าจะวัดแบบไหน
+                assert all(gap2(e, x, y, half_w, half_h) >= radius * radius for _, e in scan)
+            expect_center = closest if d2 < radius * radius else None
+            expect_edge = closest if gap2(closest, x, y, half_w, half_h) < radius * radius else None
+            assert wdmodel.within(near, kind, radius) is expect_center
+            assert wdmodel.within(near, kind, radius, mode="bounds") is expect_edge
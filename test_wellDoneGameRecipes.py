@@ -0,0 +1,85 @@
+"""Headless tests for wellDoneGameRecipes — ไม่ต้องมี Qt
+
+    python -m pytest -q
+"""
+from itertools import permutations
+
+import pytest
+
+try:
+    from . import wellDoneGameRecipes as wdrecipes
+except Exception:
+    import wellDoneGameRecipes as wdrecipes
+
+
+@pytest.fixture
+def book():
+    return wdrecipes.compile_recipes()
+
+
+def test_every_state_gets_one_id(book):
+    assert len(book) == len(set(book.names)) == len(wdrecipes.INGREDIENTS) * 3
+    for item_id, name in enumerate(book.names):
+        assert book.ids[name] == item_id
+        assert book.icons[item_id] == f"{name}_icon"
+        assert book.raw_name(item_id) == name.split("_")[0]
+    # compile ซ้ำได้ id เดิม — ออร์เดอร์/จานที่ key ไว้ยังใช้ได้
+    assert wdrecipes.compile_recipes().names == book.names
+
+
+def test_transition_tables(book):
+    tomato = book.ids["tomato"]
+    chopped = book.ids["tomato_chopped"]
+    boiled = book.ids["tomato_boiled"]
+    assert book.apply("chop", tomato) == chopped
+    assert book.apply("boil", tomato) == boiled
+    assert book.apply("boil", chopped) == boiled
+    assert book.apply("chop", chopped) == wdrecipes.NO_ITEM
+    assert book.apply("chop", boiled) == book.apply("boil", boiled) == wdrecipes.NO_ITEM
+    assert book.can(tomato, "chop") and book.can(chopped, "boil")
+    assert not book.can(chopped, "chop") and not book.actions[boiled]
+
+
+def test_parse_combo_takes_the_longest_name(book):
+    key = book.parse_combo("tomato_chopped_lettuce")
+    assert book.names_of(key) == sorted(["tomato_chopped", "lettuce"], key=book.ids.get)
+    assert book.parse_combo("lettuce_tomato_chopped") == key
+    assert book.parse_combo("tomato_fried") is None
+    assert book.combo_name(key) == "lettuce_tomato_chopped"
+
+
+def test_plate_sprite_prefers_a_finished_image():
+    finished = {"plate_lettuce_chopped_tomato_chopped"}
+    book = wdrecipes.compile_recipes(has_sprite=lambda name: name in finished)
+    assert book.plate_sprite(book.empty) == "plate"
+    key = book.parse_combo("tomato_chopped_lettuce_chopped")
+    assert book.plate_sprite(key) == "plate_lettuce_chopped_tomato_chopped"
+    # ไม่มีภาพสำเร็จ -> ชื่อภาพประกอบตามลำดับของ key
+    key = book.parse_combo("tomato_chopped_lettuce")
+    assert book.plate_sprite(key) == wdrecipes.PLATE_LAYER_SEP.join(["plate", *book.names_of(key)])
+
+
+def test_extend_matches_a_key_built_from_scratch(book):
+    chopped = [book.ids[f"{raw}_chopped"] for raw in wdrecipes.INGREDIENTS]
+    orders = [(chopped[0],), (chopped[2], chopped[0]), (chopped[1], chopped[1], chopped[0])]
+    wanted = {book.key(ids): n for n, ids in enumerate(orders)}
+    for n, ids in enumerate(orders):
+        # ใส่ทีละชิ้นทุกลำดับ — ลำดับที่ใส่ไม่มีผลต่อ key
+        for order in permutations(ids):
+            key = book.empty
+            for item_id in order:
+                key = book.extend(key, item_id)
+            scratch = book.key(ids)
+            assert key.ids == scratch.ids
+            assert hash(key) == hash(scratch)
+            assert key == scratch
+            assert wanted[key] == n
+
+
+def test_keys_with_different_contents_differ(book):
+    a, b = book.ids["tomato_chopped"], book.ids["lettuce_chopped"]
+    once = book.extend(book.empty, a)
+    twice = book.extend(once, a)
+    assert once != twice and twice != book.key((a, b))
+    assert twice == book.key((a, a)) and len(twice) == 2
+    assert book.key(()) == book.empty and book.empty != once
@@ -0,0 +1,742 @@
+import os
+import sys
+import json
+import math
+import time
+from collections import OrderedDict, deque
+from PySide6 import QtCore, QtGui
+
+try:
+    from . import wellDoneGameRecipes as wdrecipes
+except Exception:
+    import wellDoneGameRecipes as wdrecipes
+
+IMAGE_PATH = os.path.join(os.path.dirname(__file__), "source_image", "image")
+# เก็บไว้นอกโฟลเดอร์ image เพื่อไม่ให้การเขียนไฟล์นี้ไปเปลี่ยน mtime ของโฟลเดอร์ภาพ
+MANIFEST_PATH = os.path.join(os.path.dirname(__file__), "source_image", "asset_manifest.json")
+IMAGE_EXTENSIONS = (".png", ".webp", ".jpg", ".jpeg")
+
+ATLAS_DIR = os.path.join(os.path.dirname(__file__), "source_image", "atlas")
+ATLAS_INDEX = os.path.join(ATLAS_DIR, "atlas.json")
+ATLAS_SHEET_SIZE = 1024  # ขนาดสูงสุดของแต่ละแผ่น atlas
+ATLAS_CELL = 128         # icon จะถูกย่อให้ไม่เกินขนาดนี้ (พอสำหรับ 64 px ที่ dpr 2)
+ATLAS_PADDING = 2
+
+# ขนาดที่ icon/จานถูกวางในเกม — preloader จะเตรียมภาพย่อขนาดเหล่านี้ไว้ก่อน
+WARM_SIZES = ((40, 40), (60, 60), (64, 64))
+
+# เวลาสูงสุด (ms) ที่ AssetPreloader ใช้แปลงภาพต่อเฟรมบน main thread
+PROMOTE_BUDGET_MS = 4.0
+
+# ออร์เดอร์สำรองเมื่อไม่มีภาพ plate_*.png เลย
+DEFAULT_ORDER_COMBOS = ["tomato_chopped", "lettuce_chopped", "cucamber_chopped"]
+
+# งบหน่วยความจำของ cache (ไบต์) — ตั้งผ่าน env ได้ เช่น WELLDONE_PIXMAP_BUDGET=33554432
+DEFAULT_BUDGET_BYTES = 64 * 1024 * 1024
+
+
+def sprite_name(name):
+    """แปลงชื่อไฟล์เป็นชื่อ sprite เช่น 'tomato_icon.png' -> 'tomato_icon'"""
+    return os.path.splitext(os.path.basename(name))[0]
+
+
+def sprite_path(name):
+    """หา path ของ sprite จาก manifest (None ถ้าไม่มีภาพนี้)"""
+    return get_manifest().path(sprite_name(name))
+
+
+def pixmap_bytes(pix):
+    """ประมาณขนาดหน่วยความจำของ pixmap"""
+    if pix is None or pix.isNull():
+        return 0
+    return pix.width() * pix.height() * max(pix.depth(), 8) // 8
+
+
+class AssetManifest:
+    """รายการภาพทั้งหมดในโฟลเดอร์ image สร้างครั้งเดียวต่อ session
+
+    ตอบคำถาม "มีภาพนี้ไหม" และ "มีจานสูตรอะไรบ้าง" จากหน่วยความจำ
+    แทนการเรียก os.listdir / os.path.exists ซ้ำ ๆ ระหว่างเล่น
+    """
+
+    def __init__(self, files, mtime=0.0, stamps=None):
+        self.mtime = mtime
+        # file name -> [mtime, size] ของไฟล์ภาพแต่ละไฟล์ — เขียนทับไฟล์เดิมไม่เปลี่ยน
+        # mtime ของโฟลเดอร์ จึงต้องเทียบรายไฟล์ด้วย
+        self.stamps = dict(stamps or {})
+        self.files = {}  # sprite name -> file name
+        for f in sorted(files):
+            base, ext = os.path.splitext(f)
+            if ext.lower() in IMAGE_EXTENSIONS:
+                self.files.setdefault(base, f)
+
+        names = [n for n in self.files if not n.startswith("plate")]
+        # วัตถุดิบดิบ เช่น tomato_icon -> tomato
+        self.ingredients = [n[:-len("_icon")] for n in names
+                            if n.endswith("_icon") and not n.endswith("_chopped_icon")]
+        # วัตถุดิบหั่นแล้ว เช่น tomato_chopped_icon -> tomato_chopped
+        self.chopped = [n[:-len("_icon")] for n in names if n.endswith("_chopped_icon")]
+        # จานสำเร็จ plate_<items>.png (plate_icon ไม่ใช่สูตร)
+        self.plate_combos = [n[len("plate_"):] for n, f in self.files.items()
+                             if n.startswith("plate_") and n != "plate_icon"
+                             and f.lower().endswith(".png")]
+
+    def has(self, name):
+        return name in self.files
+
+    def path(self, name):
+        f = self.files.get(name)
+        return os.path.join(IMAGE_PATH, f) if f else None
+
+    def stamp(self, name):
+        """[mtime, size] ของไฟล์ภาพของ sprite name (None ถ้าไม่มี)"""
+        return self.stamps.get(self.files.get(name))
+
+    def order_combos(self):
+        return list(self.plate_combos) or list(DEFAULT_ORDER_COMBOS)
+
+    def to_dict(self):
+        return {"mtime": self.mtime, "files": sorted(self.files.values()), "stamps": self.stamps}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data.get("files", []), data.get("mtime", 0.0), data.get("stamps"))
+
+
+def _image_dir_mtime(image_path=IMAGE_PATH):
+    try:
+        return os.stat(image_path).st_mtime
+    except OSError:
+        return 0.0
+
+
+def _file_stamp(path):
+    """[mtime, size] ของไฟล์ (list เพื่อให้เทียบกับค่าที่อ่านจาก json ได้ตรง ๆ)"""
+    try:
+        st = os.stat(path)
+        return [st.st_mtime, st.st_size]
+    except OSError:
+        return None
+
+
+def _stamps_fresh(stamps, image_path=IMAGE_PATH):
+    return all(_file_stamp(os.path.join(image_path, f)) == stamp for f, stamp in stamps.items())
+
+
+def build_manifest(image_path=IMAGE_PATH):
+    """สแกนโฟลเดอร์ภาพหนึ่งครั้ง"""
+    try:
+        files = os.listdir(image_path)
+    except OSError:
+        files = []
+    manifest = AssetManifest(files, _image_dir_mtime(image_path))
+    manifest.stamps = {f: _file_stamp(os.path.join(image_path, f)) for f in manifest.files.values()}
+    return manifest
+
+
+def write_manifest(manifest, manifest_path=MANIFEST_PATH):
+    try:
+        with open(manifest_path, "w", encoding="utf-8") as f:
+            json.dump(manifest.to_dict(), f, indent=1)
+        return True
+    except OSError:
+        # เช่นโปรเจกต์อยู่บน network share ที่เขียนไม่ได้ — ใช้ manifest ในหน่วยความจำต่อ
+        return False
+
+
+def load_manifest(image_path=IMAGE_PATH, manifest_path=MANIFEST_PATH):
+    """โหลด manifest ที่สร้างไว้ล่วงหน้า ถ้า mtime ของโฟลเดอร์และ (mtime, ขนาด) ของทุกไฟล์
+    ยังตรงกัน ไม่งั้นสแกนใหม่
+    """
+    mtime = _image_dir_mtime(image_path)
+    try:
+        with open(manifest_path, encoding="utf-8") as f:
+            data = json.load(f)
+        stamps = data.get("stamps")
+        if data.get("mtime") == mtime and stamps is not None and _stamps_fresh(stamps, image_path):
+            return AssetManifest.from_dict(data)
+    except (OSError, ValueError):
+        pass
+
+    manifest = build_manifest(image_path)
+    write_manifest(manifest, manifest_path)
+    return manifest
+
+
+_manifest = None
+
+
+def get_manifest():
+    """manifest ของ session นี้ (สร้างครั้งแรกที่เรียก)"""
+    global _manifest
+    if _manifest is None:
+        _manifest = load_manifest()
+    return _manifest
+
+
+def reload_manifest():
+    """สแกนโฟลเดอร์ใหม่ เช่นหลังเพิ่มภาพระหว่าง session"""
+    global _manifest, _atlas
+    _manifest = build_manifest()
+    _atlas = None
+    write_manifest(_manifest)
+    pixmap_cache.clear()
+    return _manifest
+
+
+def is_atlas_member(name, manifest):
+    """sprite ที่รวมลง atlas: *_icon, *_chopped_icon, *_layer และ plate*"""
+    f = manifest.files.get(name)
+    return bool(f) and f.lower().endswith(".png") and (
+        name.endswith("_icon") or name.endswith("_layer") or name.startswith("plate"))
+
+
+def atlas_members(manifest):
+    return sorted(n for n in manifest.files if is_atlas_member(n, manifest))
+
+
+def pack_atlas(images, sheet_size=ATLAS_SHEET_SIZE, cell=ATLAS_CELL, padding=ATLAS_PADDING):
+    """จัดภาพลงแผ่น atlas แบบ shelf packing
+
+    images: dict ชื่อ sprite -> QImage
+    return: (sheets, rects) โดย rects[name] = (sheet index, x, y, w, h)
+    """
+    fitted = {}
+    for name, img in images.items():
+        if img.isNull():
+            continue
+        if img.width() > cell or img.height() > cell:
+            img = img.scaled(cell, cell, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
+        fitted[name] = img
+
+    sheets = []
+    rects = {}
+    painter = None
+    x = y = shelf_h = 0
+
+    def _close_sheet():
+        painter.end()
+        # ตัดส่วนที่ไม่ได้ใช้ด้านล่างของแผ่นทิ้ง
+        used_h = min(sheet_size, y + shelf_h)
+        sheets[-1] = sheets[-1].copy(0, 0, sheet_size, used_h)
+
+    # เรียงจากสูงไปต่ำ ให้แต่ละชั้นเสียพื้นที่น้อยที่สุด
+    for name in sorted(fitted, key=lambda n: (-fitted[n].height(), n)):
+        img = fitted[name]
+        w, h = img.width(), img.height()
+        if x + w > sheet_size:
+            x, y, shelf_h = 0, y + shelf_h + padding, 0
+        if painter is None or y + h > sheet_size:
+            if painter is not None:
+                _close_sheet()
+            sheet = QtGui.QImage(sheet_size, sheet_size, QtGui.QImage.Format_ARGB32_Premultiplied)
+            sheet.fill(QtCore.Qt.transparent)
+            sheets.append(sheet)
+            painter = QtGui.QPainter(sheet)
+            x = y = shelf_h = 0
+        painter.drawImage(x, y, img)
+        rects[name] = (len(sheets) - 1, x, y, w, h)
+        x += w + padding
+        shelf_h = max(shelf_h, h)
+
+    if painter is not None:
+        _close_sheet()
+    return sheets, rects
+
+
+class SpriteAtlas:
+    """แผ่น atlas และตารางชื่อ sprite -> ตำแหน่งบนแผ่น
+
+    stamps: ชื่อ sprite -> [mtime, size] ของไฟล์ต้นฉบับตอน build (ใช้ตัดสินว่า atlas เก่าไหม)
+    """
+
+    def __init__(self, rects, sheet_files=None, sheet_images=None, stamps=None):
+        self.rects = rects
+        self.sheet_files = sheet_files or []
+        self.sheet_images = sheet_images or []
+        self.stamps = stamps or {}
+
+    def __contains__(self, name):
+        return name in self.rects
+
+    def __len__(self):
+        return len(self.rects)
+
+    def sheet_count(self):
+        return max(len(self.sheet_files), len(self.sheet_images))
+
+    def sheet_image(self, index):
+        """QImage ของแผ่น (ปลอดภัยที่จะเรียกจาก worker thread)"""
+        if index < len(self.sheet_images) and self.sheet_images[index] is not None:
+            return self.sheet_images[index]
+        return QtGui.QImage(os.path.join(ATLAS_DIR, self.sheet_files[index]))
+
+    def rect(self, name):
+        index, x, y, w, h = self.rects[name]
+        return index, QtCore.QRect(x, y, w, h)
+
+    def save(self, atlas_dir=ATLAS_DIR):
+        try:
+            os.makedirs(atlas_dir, exist_ok=True)
+            files = []
+            for i, img in enumerate(self.sheet_images):
+                fname = f"atlas_{i}.png"
+                if not img.save(os.path.join(atlas_dir, fname), "PNG"):
+                    return False
+                files.append(fname)
+            with open(os.path.join(atlas_dir, "atlas.json"), "w", encoding="utf-8") as f:
+                json.dump({"stamps": self.stamps, "sheets": files, "sprites": self.rects}, f, indent=1)
+        except OSError:
+            return False
+        self.sheet_files = files
+        return True
+
+
+def build_atlas(manifest=None):
+    """ถอดรหัส icon ทั้งหมดแล้วรวมเป็น atlas (ทำงานใน worker thread ได้)"""
+    manifest = manifest or get_manifest()
+    members = atlas_members(manifest)
+    images = {name: QtGui.QImage(manifest.path(name)) for name in members}
+    sheets, rects = pack_atlas(images)
+    return SpriteAtlas(rects, sheet_images=sheets, stamps=_member_stamps(manifest, members))
+
+
+def _member_stamps(manifest, members=None):
+    return {name: manifest.stamp(name) for name in (members or atlas_members(manifest))}
+
+
+def load_atlas(manifest=None, atlas_index=ATLAS_INDEX):
+    """ใช้ atlas ที่ build ไว้แล้วถ้ายังตรงกับ manifest ไม่งั้น build ใหม่ตอนนี้เลย
+
+    atlas ยังใช้ได้เมื่อ (mtime, ขนาด) ของไฟล์ต้นฉบับทุกไฟล์ตรงกับตอน build — ชุดของ
+    sprite ที่เพิ่ม/ลบ และไฟล์ที่ถูกเขียนทับในที่เดิมจึงทำให้ build ใหม่ทั้งคู่
+    """
+    manifest = manifest or get_manifest()
+    try:
+        with open(atlas_index, encoding="utf-8") as f:
+            data = json.load(f)
+        rects = {name: tuple(r) for name, r in data.get("sprites", {}).items()}
+        sheets = data.get("sheets", [])
+        stamps = _member_stamps(manifest)
+        if (data.get("stamps") == stamps
+                and all(os.path.exists(os.path.join(ATLAS_DIR, f)) for f in sheets)):
+            return SpriteAtlas(rects, sheet_files=sheets, stamps=stamps)
+    except (OSError, ValueError, TypeError):
+        pass
+
+    atlas = build_atlas(manifest)
+    if len(atlas):
+        atlas.save()
+    return atlas
+
+
+_atlas = None
+
+
+def get_atlas():
+    """atlas ของ session นี้ (โหลดหรือ build ครั้งแรกที่เรียก)"""
+    global _atlas
+    if _atlas is None:
+        _atlas = load_atlas()
+    return _atlas
+
+
+def compose_plate(base, layers):
+    """วาดวัตถุดิบแต่ละชิ้นทับภาพจานเปล่า
+
+    base: (pixmap, source rect) ของภาพจานเปล่า (ดู PixmapCache.source)
+    layers: list ของ (pixmap, source rect, full) — full=True คือภาพ <ของ>_layer
+    ขนาดเท่าจาน (วาดเต็มจาน) ไม่งั้นเป็น icon ที่จัดวางเป็นวงรอบกลางจาน
+    """
+    base_pix, base_rect = base
+    size = base_rect.size() if not base_pix.isNull() else QtCore.QSize(ATLAS_CELL, ATLAS_CELL)
+    image = QtGui.QImage(size, QtGui.QImage.Format_ARGB32_Premultiplied)
+    image.fill(QtCore.Qt.transparent)
+    painter = QtGui.QPainter(image)
+    painter.setRenderHint(QtGui.QPainter.SmoothPixmapTransform)
+    if not base_pix.isNull():
+        painter.drawPixmap(image.rect(), base_pix, base_rect)
+
+    icons = []
+    for pix, rect, full in layers:
+        if pix.isNull():
+            continue
+        if full:
+            painter.drawPixmap(image.rect(), pix, rect)
+        else:
+            icons.append((pix, rect))
+
+    w, h = size.width(), size.height()
+    side = int(min(w, h) * 0.4)
+    radius = 0.0 if len(icons) == 1 else min(w, h) * 0.2
+    for i, (pix, rect) in enumerate(icons):
+        angle = 2 * math.pi * i / len(icons) - math.pi / 2
+        cx = w / 2 + radius * math.cos(angle)
+        cy = h / 2 + radius * math.sin(angle)
+        painter.drawPixmap(QtCore.QRect(int(cx - side / 2), int(cy - side / 2), side, side), pix, rect)
+    painter.end()
+    return QtGui.QPixmap.fromImage(image)
+
+
+class PixmapCache:
+    """LRU cache ของ QPixmap คีย์ด้วยชื่อ sprite และจำกัดขนาดด้วย budget เป็นไบต์
+
+    ทุกการโหลดภาพในเกมควรผ่าน cache นี้ แทนการสร้าง QtGui.QPixmap(path) ใหม่ทุกครั้ง
+    ภาพที่หาไม่เจอจะถูก cache เป็น null pixmap ด้วย เพื่อไม่ให้ไปถามดิสก์ซ้ำ
+
+    ชื่อภาพจานประกอบ (plate+<ของ>+...) ถูกวาดจากภาพจานเปล่ากับ layer ของแต่ละชิ้น
+    แล้ว cache ด้วยชื่อนั้น — ชุดเดิมครั้งถัดไปไม่ต้องวาดหรืออ่านไฟล์ใหม่
+
+    sprite ที่อยู่ใน atlas ไม่ถูกเก็บเป็น pixmap ขนาดเต็มของตัวเอง: scaled() ตัดกรอบจากแผ่น
+    ครั้งเดียวต่อ (sprite, ขนาด, dpr) แล้วเก็บเฉพาะภาพที่ย่อแล้ว ส่วน compose_plate
+    วาดจากแผ่นตรง ๆ ผ่าน source()
+    """
+
+    def __init__(self, budget_bytes=DEFAULT_BUDGET_BYTES):
+        self._entries = OrderedDict()  # key -> (pixmap, nbytes)
+        self.budget_bytes = budget_bytes
+        self.used_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.composed = 0
+
+    def __contains__(self, name):
+        return sprite_name(name) in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, name):
+        key = sprite_name(name)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+        self.misses += 1
+        return self._load(key)
+
+    def _fetch(self, key):
+        """pixmap ของ key โดยไม่นับ hit/miss — ใช้ภายในเมื่อ lookup ของผู้เรียกถูกนับไปแล้ว"""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            return entry[0]
+        return self._load(key)
+
+    def _load(self, key):
+        """โหลด (หรือวาดจานประกอบ) แล้วเก็บลง cache"""
+        if wdrecipes.PLATE_LAYER_SEP in key:
+            pix = self._compose(key)
+            self.insert(key, pix)
+            return pix
+        manifest = get_manifest()
+        # ถามหา atlas เฉพาะ sprite ที่อยู่ใน atlas (ภาพพื้นหลังไม่ต้องรอ build atlas)
+        atlas = get_atlas() if is_atlas_member(key, manifest) else None
+        if atlas is not None and key in atlas:
+            pix = self._from_atlas(atlas, key)
+        else:
+            path = manifest.path(key)
+            pix = QtGui.QPixmap(path) if path else QtGui.QPixmap()
+        self.insert(key, pix)
+        return pix
+
+    def _compose(self, key):
+        base, *items = key.split(wdrecipes.PLATE_LAYER_SEP)
+        manifest = get_manifest()
+        layers = []
+        for item in items:
+            # ใช้ภาพ layer เฉพาะของจานถ้ามี ไม่งั้นใช้ icon ของวัตถุดิบนั้น
+            layer = f"{item}_layer"
+            if manifest.has(layer):
+                layers.append((*self._source_or_whole(layer), True))
+            else:
+                layers.append((*self._source_or_whole(f"{item}_icon"), False))
+        self.composed += 1
+        return compose_plate(self._source_or_whole(base), layers)
+
+    def source(self, name):
+        """(แผ่น atlas, QRect ของ sprite ในแผ่น) หรือ None ถ้า sprite นี้ไม่ได้อยู่ใน atlas
+
+        ไม่ copy ภาพออกมา — ผู้วาดใช้ painter.drawPixmap(target, sheet, rect)
+        """
+        key = sprite_name(name)
+        manifest = get_manifest()
+        if not is_atlas_member(key, manifest):
+            return None
+        atlas = get_atlas()
+        if atlas is None or key not in atlas:
+            return None
+        index, rect = atlas.rect(key)
+        return self._sheet(atlas, index), rect
+
+    def _source_or_whole(self, name):
+        """(pixmap, กรอบที่ใช้วาด) — กรอบใน atlas ถ้ามี ไม่งั้นทั้งภาพของ get()"""
+        src = self.source(name)
+        if src is not None:
+            return src
+        pix = self._fetch(sprite_name(name))
+        return pix, pix.rect()
+
+    def _sheet(self, atlas, index):
+        sheet_key = ("atlas", index)
+        entry = self._entries.get(sheet_key)
+        if entry is not None:
+            self._entries.move_to_end(sheet_key)
+            return entry[0]
+        sheet = QtGui.QPixmap.fromImage(atlas.sheet_image(index))
+        self.insert(sheet_key, sheet)
+        return sheet
+
+    def _from_atlas(self, atlas, key):
+        # ภาพแยกของ sprite ใน atlas สำหรับผู้ที่ต้องการ pixmap ของตัวเอง (เช่น QLabel)
+        # — renderer และ compose_plate วาดจากแผ่นตรง ๆ ผ่าน source() แทน
+        index, rect = atlas.rect(key)
+        return self._sheet(atlas, index).copy(rect)
+
+    def scaled(self, name, width, height, dpr=1.0):
+        """pixmap ที่ย่อ/ขยายแบบ smooth ไว้แล้วตามขนาดที่แสดงจริง
+
+        คีย์ด้วย (sprite, ขนาด, device pixel ratio) เพื่อให้ label วาดแบบ 1:1
+        โดยไม่ต้องให้ Qt ย่อภาพต้นฉบับใหม่ทุกครั้งที่ repaint
+        """
+        width, height, dpr = int(width), int(height), float(dpr or 1.0)
+        key = (sprite_name(name), width, height, dpr)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+        # นับ lookup นี้ครั้งเดียว — ภาพต้นฉบับดึงแบบไม่นับซ้ำ
+        self.misses += 1
+        if width <= 0 or height <= 0:
+            return self._fetch(key[0])
+        src = self.source(key[0])
+        if src is not None:
+            # sprite ใน atlas: ตัดกรอบครั้งเดียวสำหรับขนาดนี้ (ไม่ cache ภาพขนาดเต็ม)
+            sheet, rect = src
+            base = sheet.copy(rect)
+        else:
+            base = self._fetch(key[0])
+        if base.isNull():
+            return base
+        pix = base.scaled(
+            max(1, round(width * dpr)), max(1, round(height * dpr)),
+            QtCore.Qt.IgnoreAspectRatio, QtCore.Qt.SmoothTransformation
+        )
+        pix.setDevicePixelRatio(dpr)
+        self.insert(key, pix)
+        return pix
+
+    def insert(self, key, pix):
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.used_bytes -= old[1]
+        nbytes = pixmap_bytes(pix)
+        self._entries[key] = (pix, nbytes)
+        self.used_bytes += nbytes
+        self._evict()
+
+    def set_budget(self, budget_bytes):
+        self.budget_bytes = budget_bytes
+        self._evict()
+
+    def clear(self):
+        self._entries.clear()
+        self.used_bytes = 0
+
+    def stats(self):
+        return {
+            "entries": len(self._entries),
+            "used_bytes": self.used_bytes,
+            "budget_bytes": self.budget_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "composed": self.composed,
+        }
+
+    def _evict(self):
+        # เก็บตัวล่าสุดไว้เสมอ แม้ภาพเดียวจะใหญ่เกิน budget
+        while self.used_bytes > self.budget_bytes and len(self._entries) > 1:
+            _, (_, nbytes) = self._entries.popitem(last=False)
+            self.used_bytes -= nbytes
+            self.evictions += 1
+
+
+pixmap_cache = PixmapCache(int(os.environ.get("WELLDONE_PIXMAP_BUDGET", DEFAULT_BUDGET_BYTES)))
+
+
+def get_pixmap(name):
+    """โหลด pixmap ผ่าน cache กลางของเกม"""
+    return pixmap_cache.get(name)
+
+
+def set_label_sprite(label, name, width=None, height=None):
+    """ใส่ภาพที่ย่อไว้แล้วให้ QLabel วาดแบบ 1:1 (แทน setScaledContents(True))
+
+    ถ้าไม่ระบุขนาดจะใช้ขนาดปัจจุบันของ label
+    """
+    if width is None or height is None:
+        width, height = label.width(), label.height()
+    pix = pixmap_cache.scaled(name, width, height, label.devicePixelRatioF())
+    label.setScaledContents(False)
+    label.setPixmap(pix)
+    return pix
+
+
+class _DecodeSignals(QtCore.QObject):
+    decoded = QtCore.Signal(object, object)  # (key, ผลลัพธ์)
+
+
+class _DecodeTask(QtCore.QRunnable):
+    """ถอดรหัสภาพใน worker thread — ใช้ได้แค่ QImage ห้ามสร้าง QPixmap ที่นี่"""
+
+    def __init__(self, key, load, signals):
+        super().__init__()
+        self.key = key
+        self.load = load
+        self.signals = signals
+
+    def run(self):
+        try:
+            result = self.load()
+        except Exception:
+            result = None
+        try:
+            self.signals.decoded.emit(self.key, result)
+        except RuntimeError:
+            # หน้าต่างถูกปิดไปแล้วระหว่างโหลด
+            pass
+
+
+class AssetPreloader(QtCore.QObject):
+    """โหลดภาพทั้งหมดใน manifest ล่วงหน้าระหว่างที่หน้าเมนูแสดงอยู่
+
+    ถอดรหัสเป็น QImage บน QThreadPool แล้วค่อย ๆ แปลงเป็น QPixmap บน main thread
+    ไม่เกิน batch_size ภาพและไม่เกิน budget_ms ต่อเฟรม (อย่างน้อยหนึ่งภาพ)
+    เพื่อไม่ให้ viewport ของ Maya กระตุก
+    """
+
+    progress = QtCore.Signal(int, int)  # (พร้อมแล้ว, ทั้งหมด)
+    ready = QtCore.Signal()
+
+    def __init__(self, parent=None, cache=None, batch_size=8, interval_ms=16,
+                 warm_sizes=WARM_SIZES, dpr=1.0, pool=None, budget_ms=PROMOTE_BUDGET_MS):
+        super().__init__(parent)
+        self.cache = cache or pixmap_cache
+        self.batch_size = batch_size
+        self.budget_ms = budget_ms
+        self.warm_sizes = warm_sizes
+        self.dpr = dpr
+        self.pool = pool or QtCore.QThreadPool.globalInstance()
+        self.total = 0
+        self.done = 0
+        self.is_ready = False
+
+        self._signals = _DecodeSignals(self)
+        self._signals.decoded.connect(self._on_decoded)
+        self._pending = deque()  # (op, key, extra) รอทำบน main thread
+        self._waiting = 0        # งานที่ยังอยู่ใน worker
+        self._timer = QtCore.QTimer(self)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self._promote_batch)
+
+    def start(self):
+        manifest = get_manifest()
+        names = [n for n in manifest.files if n not in self.cache]
+        members = [n for n in names if is_atlas_member(n, manifest)]
+        others = [n for n in names if not is_atlas_member(n, manifest)]
+        # sprite ใน atlas ไม่เก็บภาพขนาดเต็มแยก — นับแผ่น (ตอนได้ atlas) กับภาพย่อของแต่ละขนาด
+        self.total = len(others) + len(members) * len(self.warm_sizes)
+        self.done = 0
+        self.is_ready = False
+
+        for name in others:
+            self._submit(name, lambda path=manifest.path(name): QtGui.QImage(path))
+        if members:
+            # build atlas ครั้งแรก (ถ้ายังไม่มี) ก็ทำใน worker เช่นกัน
+            self._submit("atlas", lambda: _atlas or load_atlas(manifest))
+        if not self._waiting:
+            QtCore.QTimer.singleShot(0, self._finish)
+
+    def _submit(self, key, load):
+        self._waiting += 1
+        self.pool.start(_DecodeTask(key, load, self._signals))
+
+    def _on_decoded(self, key, result):
+        self._waiting -= 1
+        if key == "atlas":
+            if result is not None:
+                self._install_atlas(result)
+        else:
+            self._pending.append(("pixmap", key, result))
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def _install_atlas(self, atlas):
+        global _atlas
+        _atlas = atlas
+        self.total += atlas.sheet_count()
+        for index in range(atlas.sheet_count()):
+            self._submit(("atlas", index), lambda i=index: atlas.sheet_image(i))
+
+    def _promote_batch(self):
+        deadline = time.perf_counter() + self.budget_ms / 1000.0
+        for i in range(self.batch_size):
+            if not self._pending or (i and time.perf_counter() >= deadline):
+                break
+            op, key, extra = self._pending.popleft()
+            if op == "pixmap":
+                pix = QtGui.QPixmap.fromImage(extra) if extra is not None and not extra.isNull() else QtGui.QPixmap()
+                self.cache.insert(key, pix)
+                if isinstance(key, tuple):
+                    # แผ่น atlas: เตรียมภาพย่อของ sprite ในแผ่นนี้ไว้ในเฟรมถัด ๆ ไป
+                    for name, rect in _atlas.rects.items():
+                        if rect[0] == key[1]:
+                            for size in self.warm_sizes:
+                                self._pending.append(("scale", name, size))
+            elif op == "scale":
+                self.cache.scaled(key, extra[0], extra[1], self.dpr)
+            self.done += 1
+        self.progress.emit(min(self.done, self.total), self.total)
+
+        if not self._pending and not self._waiting:
+            self._timer.stop()
+            self._finish()
+
+    def _finish(self):
+        self.is_ready = True
+        self.progress.emit(self.total, self.total)
+        self.ready.emit()
+
+
+def main(argv=None):
+    """build asset ล่วงหน้า: python -m wellDoneGameAssets manifest|atlas"""
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] not in ("manifest", "atlas"):
+        print("usage: python -m wellDoneGameAssets manifest|atlas")
+        return 2
+
+    manifest = build_manifest()
+    if not write_manifest(manifest):
+        print(f"⚠️ เขียน {MANIFEST_PATH} ไม่ได้")
+        return 1
+    print(f"✅ manifest: {len(manifest.files)} ภาพ, {len(manifest.plate_combos)} สูตรจาน -> {MANIFEST_PATH}")
+
+    if argv[0] == "atlas":
+        # QPainter/QImage ต้องมี QGuiApplication — ไม่ต้องเปิดหน้าต่าง
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        app = QtGui.QGuiApplication.instance() or QtGui.QGuiApplication(sys.argv[:1])
+        atlas = build_atlas(manifest)
+        if not atlas.save():
+            print(f"⚠️ เขียน atlas ลง {ATLAS_DIR} ไม่ได้")
+            return 1
+        print(f"✅ atlas: {len(atlas)} sprite ใน {atlas.sheet_count()} แผ่น -> {ATLAS_DIR}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
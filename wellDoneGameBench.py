@@ -0,0 +1,169 @@
+"""Render benchmark: QLabel ต่อชิ้น (แบบเดิม) เทียบกับ SpriteCanvas
+
+    python -m wellDoneGameBench                          # 10, 100, 1000 ชิ้น
+    python -m wellDoneGameBench --counts 10 100 --frames 120
+    python -m wellDoneGameBench --offscreen              # ไม่เปิดหน้าต่าง
+    python -m wellDoneGameBench --levels classic restaurant   # เทียบด่านห้องเดียวกับด่านใหญ่
+
+ทุกเฟรมขยับทุกชิ้นแล้ว repaint() ทันที (วาดแบบ synchronous) เพื่อวัดเวลาต่อเฟรมจริง
+"""
+import os
+import sys
+import time
+import random
+import argparse
+
+SIZE = (1280, 720)
+ICON = 40
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="wellDoneGameBench", description="Compare QLabel-per-item vs single-canvas rendering")
+    parser.add_argument("--counts", type=int, nargs="+", default=[10, 100, 1000],
+                        help="number of moving items per run (default: 10 100 1000)")
+    parser.add_argument("--frames", type=int, default=60, help="frames measured per run (default: 60)")
+    parser.add_argument("--offscreen", action="store_true", help="render with QT_QPA_PLATFORM=offscreen")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--levels", nargs="*", default=None,
+                        help="also time GameWidget on these levels with the chef walking (e.g. classic restaurant)")
+    return parser.parse_args(argv)
+
+
+def _percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.offscreen:
+        os.environ["QT_QPA_PLATFORM"] = "offscreen"
+
+    from PySide6 import QtCore, QtGui, QtWidgets
+    try:
+        from . import wellDoneGameAssets as wdassets
+        from . import wellDoneGameRender as wdrender
+    except Exception:
+        import wellDoneGameAssets as wdassets
+        import wellDoneGameRender as wdrender
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv[:1])
+
+    # ใช้ icon จริงถ้ามี ไม่งั้นสร้างภาพสี่เหลี่ยมแทน (ทั้งสองแบบใช้ภาพเดียวกัน)
+    sprite = "tomato_icon"
+    if not wdassets.get_manifest().has(sprite):
+        sprite = "bench_sprite"
+        pix = QtGui.QPixmap(ICON, ICON)
+        pix.fill(QtGui.QColor("#E53935"))
+        wdassets.pixmap_cache.insert(sprite, pix)
+
+    class LabelScene(QtWidgets.QWidget):
+        """แบบเดิม: QLabel หนึ่งตัวต่อชิ้น + stylesheet ของ parent ที่ cascade ลงลูก"""
+
+        def __init__(self, positions):
+            super().__init__()
+            self.setStyleSheet("background-color: #8BC34A;")
+            self.items = []
+            for x, y in positions:
+                label = QtWidgets.QLabel(self)
+                label.setAttribute(QtCore.Qt.WA_TranslucentBackground)
+                label.setStyleSheet("background: transparent;")
+                label.setGeometry(x, y, ICON, ICON)
+                wdassets.set_label_sprite(label, sprite, ICON, ICON)
+                self.items.append(label)
+
+        def move_all(self, positions):
+            for label, (x, y) in zip(self.items, positions):
+                label.move(x, y)
+
+    class CanvasScene(wdrender.SpriteCanvas):
+        """แบบใหม่: sprite ทั้งหมดวาดใน paintEvent เดียว"""
+
+        def __init__(self, positions):
+            super().__init__(background="#8BC34A")
+            self.items = [self.create_sprite(sprite, x, y, ICON, ICON, z=3) for x, y in positions]
+
+        def move_all(self, positions):
+            for item, (x, y) in zip(self.items, positions):
+                self.set_geometry(item, x, y)
+
+    rng = random.Random(args.seed)
+    rows = []
+    for count in args.counts:
+        base = [(rng.randrange(0, SIZE[0] - ICON), rng.randrange(0, SIZE[1] - ICON)) for _ in range(count)]
+        frames = [[((x + f * 3) % (SIZE[0] - ICON), y) for x, y in base] for f in range(args.frames)]
+
+        for label, scene_cls in (("QLabel per item", LabelScene), ("SpriteCanvas", CanvasScene)):
+            t0 = time.perf_counter()
+            scene = scene_cls(base)
+            scene.resize(*SIZE)
+            scene.show()
+            app.processEvents()
+            build_ms = (time.perf_counter() - t0) * 1000.0
+
+            times = []
+            for positions in frames:
+                t = time.perf_counter()
+                scene.move_all(positions)
+                scene.repaint()
+                app.processEvents()
+                times.append((time.perf_counter() - t) * 1000.0)
+
+            scene.close()
+            scene.deleteLater()
+            app.processEvents()
+            rows.append((count, label, build_ms, sum(times) / len(times), _percentile(times, 0.95)))
+
+    if args.levels:
+        level_rows = bench_levels(app, args.levels, args.frames)
+
+    print(f"🏁 render benchmark ({args.frames} frames, {SIZE[0]}x{SIZE[1]}, sprite={sprite})")
+    print(f"   {'items':>6}  {'renderer':<16}{'build ms':>10}{'frame ms':>10}{'p95 ms':>10}")
+    for count, label, build_ms, mean_ms, p95_ms in rows:
+        print(f"   {count:>6}  {label:<16}{build_ms:>10.1f}{mean_ms:>10.2f}{p95_ms:>10.2f}")
+
+    if args.levels:
+        print("🍳 kitchen levels (chef walking, camera follows)")
+        print(f"   {'level':<12}{'world':>12}{'sprites':>9}{'painted':>9}{'frame ms':>10}{'p95 ms':>10}")
+        for level, world, total, painted, mean_ms, p95_ms in level_rows:
+            print(f"   {level:<12}{world:>12}{total:>9}{painted:>9}{mean_ms:>10.2f}{p95_ms:>10.2f}")
+    return 0
+
+
+def bench_levels(app, levels, frames):
+    """เวลาต่อเฟรมของ GameWidget จริงในแต่ละด่าน ขณะเชฟเดินไปทางขวา"""
+    from PySide6 import QtCore
+    try:
+        from . import wellDoneGameUi as wdui
+    except Exception:
+        import wellDoneGameUi as wdui
+
+    rows = []
+    for level in levels:
+        widget = wdui.GameWidget(level=level)
+        widget.resize(*SIZE)
+        widget.show()
+        app.processEvents()
+        widget.pressed_keys.add(QtCore.Qt.Key_Right)
+
+        times = []
+        painted = 0
+        for _ in range(frames):
+            t = time.perf_counter()
+            widget.update_position()
+            widget.repaint()
+            app.processEvents()
+            times.append((time.perf_counter() - t) * 1000.0)
+            painted = max(painted, widget.painted_sprites)
+
+        world = widget.world_size or (widget.width(), widget.height())
+        rows.append((widget.level, f"{world[0]}x{world[1]}", len(widget.sprites), painted,
+                     sum(times) / len(times), _percentile(times, 0.95)))
+        widget.close()
+        widget.deleteLater()
+        app.processEvents()
+    return rows
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+"""Run Well Done! outside Maya, with startup timings.
+
+    python -m wellDoneGameLauncher                      # เปิดหน้าต่างปกติ
+    python -m wellDoneGameLauncher --play               # เข้าเกมทันทีเมื่อโหลดภาพเสร็จ
+    python -m wellDoneGameLauncher --offscreen          # ไม่มีหน้าต่าง (QT_QPA_PLATFORM=offscreen)
+    python -m wellDoneGameLauncher --offscreen --seconds 5
+    python -m wellDoneGameLauncher --play --level restaurant   # ด่านหลายห้อง กล้องเลื่อนตามเชฟ
+    python -m wellDoneGameLauncher --play --frame-budget 2     # งบเวลาต่อเฟรม (ms) ของ game loop
+"""
+import os
+import sys
+import time
+import argparse
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="wellDoneGameLauncher", description="Run Well Done! without Maya")
+    parser.add_argument("--offscreen", action="store_true",
+                        help="render with QT_QPA_PLATFORM=offscreen (no window, for profiling/CI)")
+    parser.add_argument("--play", action="store_true",
+                        help="switch to the game page as soon as the asset preloader is ready")
+    parser.add_argument("--seconds", type=float, default=None,
+                        help="quit after this many seconds (default: 3 offscreen, run until closed windowed)")
+    parser.add_argument("--level", default=None,
+                        help="kitchen layout from wellDoneGameModel.LEVELS (default: classic)")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="seed the order queue for a repeatable run (default: random, or $WELLDONE_SEED)")
+    parser.add_argument("--frame-budget", type=float, default=None,
+                        help="main-thread budget per game tick in ms (default: 4, or $WELLDONE_FRAME_BUDGET_MS)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    t0 = time.perf_counter()
+    args = parse_args(argv)
+    if args.offscreen:
+        os.environ["QT_QPA_PLATFORM"] = "offscreen"
+    if args.level:
+        os.environ["WELLDONE_LEVEL"] = args.level
+    if args.seed is not None:
+        os.environ["WELLDONE_SEED"] = str(args.seed)
+    if args.frame_budget is not None:
+        os.environ["WELLDONE_FRAME_BUDGET_MS"] = str(args.frame_budget)
+    seconds = args.seconds if args.seconds is not None else (3.0 if args.offscreen else 0.0)
+
+    timings = []
+
+    def mark(label, since):
+        now = time.perf_counter()
+        timings.append((label, (now - since) * 1000.0))
+        return now
+
+    from PySide6 import QtCore, QtWidgets
+    from shiboken6 import isValid
+    t = mark("import PySide6", t0)
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv[:1])
+    t = mark("QApplication", t)
+
+    try:
+        from . import wellDoneGameUi as wdui
+    except Exception:
+        import wellDoneGameUi as wdui
+    t = mark("import wellDoneGameUi", t)
+
+    window = wdui.WellDoneGame()
+    t = mark("WellDoneGame()", t)
+    window.show()
+
+    menu = window.page1
+
+    def _on_ready():
+        timings.append(("assets ready (total)", (time.perf_counter() - t0) * 1000.0))
+        if args.play:
+            window.stacked.setCurrentIndex(2)
+
+    if menu.preloader.is_ready:
+        _on_ready()
+    else:
+        menu.preloader.ready.connect(_on_ready)
+
+    # เก็บสถิติไว้ก่อนหน้าต่างถูกลบ: ปุ่ม EXIT ของเมนู hide() แล้ว deleteLater()
+    # (ไม่ผ่าน close() จึงไม่มี lastWindowClosed) — ออกจาก exec เมื่อหน้าต่างถูกลบแทน
+    report = {}
+
+    def collect():
+        if not isValid(window):
+            return
+        report["time_to_first_frame"] = window.time_to_first_frame
+        if window.stacked.is_built(2):
+            game_widget = window.page3.game_widget
+            report["pool"] = game_widget.pool.stats()
+            report["loop"] = game_widget.loop.stats()
+
+    class HideWatcher(QtCore.QObject):
+        def eventFilter(self, obj, event):
+            if event.type() == QtCore.QEvent.Hide:
+                collect()
+            return False
+
+    hide_watcher = HideWatcher()
+    window.installEventFilter(hide_watcher)
+    app.aboutToQuit.connect(collect)
+    window.destroyed.connect(app.quit)
+
+    if seconds > 0:
+        QtCore.QTimer.singleShot(int(seconds * 1000), app.quit)
+    code = app.exec()
+
+    if report.get("time_to_first_frame") is not None:
+        timings.append(("time-to-first-frame", report["time_to_first_frame"]))
+    print("⏱️ startup timings")
+    for label, ms in timings:
+        print(f"   {label:<24}{ms:9.1f} ms")
+
+    if "loop" in report:
+        pool = report["pool"]
+        print(f"♻️ sprite pool: live {pool['live']} (peak {pool['peak']}), "
+              f"created {pool['created']}, reused {pool['reused']}, free {pool['free']}")
+        stats = report["loop"]
+        print(f"⏱️ game loop: {stats['steps']} steps in {stats['frames']} frames, {stats['sleeps']} sleeps, "
+              f"dropped {stats['dropped_seconds']:.2f} s, deferred {stats['deferred_runs']} "
+              f"(carried {stats['deferred_carried']})")
+        print(f"🐢 event-loop lag (budget {stats['budget_ms']:g} ms, over budget {stats['over_budget']}x)")
+        for label, key in (("seen (Maya -> game)", "lag_seen_ms"), ("caused (game -> Maya)", "lag_caused_ms")):
+            lag = stats[key]
+            print(f"   {label:<24}avg {lag['avg']:6.2f}  p95 {lag['p95']:6.2f}  max {lag['max']:6.2f} ms")
+    return code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
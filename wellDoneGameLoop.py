@@ -0,0 +1,343 @@
+"""Fixed-timestep game loop for Well Done!
+
+simulation เดินทีละ step คงที่ (wellDoneGameModel.TICK_SECONDS) ตามเวลาจริงจาก
+time.perf_counter() ไม่ได้นับจำนวนครั้งที่ QTimer ยิง — ถ้า Maya ค้างไปครู่หนึ่ง รอบถัดไป
+จะเดิน step ที่ค้างให้ทัน (ไม่เกิน max_steps) แล้วค่อยวาดครั้งเดียว ความเร็วของเกมจึง
+เท่ากันทั้งเครื่องที่ว่างและเครื่องที่ทำงานหนัก
+
+นาฬิกาของเกม (สัญญาณ second) นับจากเวลาที่ simulate ไปแล้ว จึงตรงกับการเดินของเชฟเสมอ
+
+ถ้าไม่มีอะไรขยับ (is_idle) loop จะไม่ tick ทุก 16 ms แต่หลับยาวจนถึงวินาทีถัดไปของ
+นาฬิกาเกมหรือ deadline ของงานที่ใกล้ที่สุด แล้วเดินเวลาที่หลับไปในครั้งเดียว — เกมที่
+เปิดทิ้งไว้ใน Maya แทบไม่กิน CPU ส่วนตอนหน้าต่างไม่ได้ focus/ถูกย่อ จะ tick ห่างลง
+
+เกมใช้ main thread ร่วมกับ Maya ทุก tick จึงมีงบเวลา (budget_ms) — simulate และ render
+ต้องทำทุกเฟรม ส่วนงานที่รอได้ (defer) เช่นข้อความ HUD หรือกรอบไฮไลต์ จะทำในเวลาที่เหลือ
+ของเฟรม ที่ไม่ทันก็ยกไปเฟรมถัดไป LatencyMonitor วัดทั้ง lag ที่เกมเจอ (timer มาช้าเพราะ
+Maya ทำงานหนัก) และ lag ที่เกมทำให้ Maya (เวลาที่เราถือ main thread ต่อครั้ง)
+"""
+import os
+import math
+import time
+from collections import deque
+from contextlib import contextmanager
+
+from PySide6 import QtCore
+
+try:
+    from . import wellDoneGameModel as wdmodel
+except Exception:
+    import wellDoneGameModel as wdmodel
+
+# ตามได้สูงสุดกี่ step ต่อรอบ (~128 ms) ที่ค้างเกินกว่านี้ถือว่าหายไป
+# เพื่อไม่ให้เชฟวาร์ปไกลหลัง Maya ค้างนาน ๆ
+MAX_CATCHUP_STEPS = 8
+THROTTLE_INTERVAL_MS = 100  # ระยะ tick ตอนหน้าต่างไม่ได้ focus/ถูกย่อ
+# เวลาที่เกมขอใช้ main thread ต่อเฟรม (ms) ที่เหลือของ 16 ms คืนให้ viewport ของ Maya
+FRAME_BUDGET_MS = float(os.environ.get("WELLDONE_FRAME_BUDGET_MS", 4.0))
+LATENCY_WINDOW = 240  # จำนวนตัวอย่างล่าสุดที่ LatencyMonitor เก็บ (~4 วินาทีที่ 60 fps)
+
+
+def _summary(samples):
+    if not samples:
+        return {"avg": 0.0, "p95": 0.0, "max": 0.0}
+    ordered = sorted(samples)
+    return {
+        "avg": sum(ordered) / len(ordered),
+        "p95": ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))],
+        "max": ordered[-1],
+    }
+
+
+class LatencyMonitor:
+    """วัด lag ของ event loop ที่ใช้ร่วมกับ Maya ทั้งสองทาง (หน่วย ms)
+
+    seen:   timer ของเกมตื่นช้ากว่าที่ตั้งไว้เท่าไร (Maya/host ถือ main thread อยู่)
+    caused: เกมถือ main thread ต่อครั้งนานเท่าไร (tick หรือ key handler) — ครั้งที่เกิน
+            budget_ms นับไว้ใน over_budget
+    """
+
+    def __init__(self, budget_ms=FRAME_BUDGET_MS, window=LATENCY_WINDOW, clock=time.perf_counter):
+        self.budget_ms = budget_ms
+        self.clock = clock
+        self.seen = deque(maxlen=window)
+        self.caused = deque(maxlen=window)
+        self.over_budget = 0
+        self._depth = 0
+
+    def record_wake(self, late_seconds):
+        self.seen.append(max(0.0, late_seconds * 1000.0))
+
+    def record_work(self, seconds):
+        ms = seconds * 1000.0
+        self.caused.append(ms)
+        if ms > self.budget_ms:
+            self.over_budget += 1
+
+    @contextmanager
+    def measure(self):
+        """จับเวลางานหนึ่งครั้งบน main thread (ซ้อนกันได้ นับเฉพาะชั้นนอกสุด)"""
+        self._depth += 1
+        t0 = self.clock()
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            if not self._depth:
+                self.record_work(self.clock() - t0)
+
+    def reset(self):
+        self.seen.clear()
+        self.caused.clear()
+        self.over_budget = 0
+
+    def stats(self):
+        return {
+            "lag_seen_ms": _summary(self.seen),
+            "lag_caused_ms": _summary(self.caused),
+            "over_budget": self.over_budget,
+        }
+
+
+class GameLoop(QtCore.QObject):
+    """วน simulate(dt) ทีละ step คงที่ตามเวลาจริง แล้วเรียก render() หลังเดินเสร็จ
+
+    simulate: callable(dt) เดินเกมหนึ่ง step
+    render:   callable() วาดผลลัพธ์ (เรียกเฉพาะรอบที่มี step เดิน)
+    clock:    ฟังก์ชันเวลา (วินาที) ค่าเริ่มต้น time.perf_counter
+    is_idle:       callable() -> True ถ้าไม่มีอะไรขยับ (ให้ loop หลับได้)
+    next_deadline: callable() -> วินาทีจนถึงงานถัดไปที่ต้องตื่นมาทำ หรือ None
+    is_throttled:  callable() -> True ถ้าควร tick ห่างลง (หน้าต่างไม่ได้ focus/ถูกย่อ)
+
+    ตอนหลับ simulate จะถูกเรียกครั้งเดียวด้วย dt = เวลาที่หลับไป ดังนั้น simulate
+    ต้องรับ dt ยาว ๆ ได้เมื่อ is_idle() เป็นจริง (ไม่มีการเคลื่อนที่ มีแต่งานที่นับถอยหลัง)
+
+    budget_ms: งบเวลาต่อ tick — งานจาก defer() ทำหลัง render เท่าที่งบเหลือ (อย่างน้อย
+    หนึ่งงานต่อ tick เพื่อไม่ให้ค้างตลอดไป)
+    """
+    second = QtCore.Signal()  # ทุก 1 วินาทีของเวลาเกม
+
+    def __init__(self, simulate, render=None, step=wdmodel.TICK_SECONDS,
+                 max_steps=MAX_CATCHUP_STEPS, clock=time.perf_counter, parent=None,
+                 is_idle=None, next_deadline=None, is_throttled=None,
+                 throttle_ms=THROTTLE_INTERVAL_MS, budget_ms=FRAME_BUDGET_MS):
+        super().__init__(parent)
+        self.simulate = simulate
+        self.render = render
+        self.step = step
+        self.max_steps = max_steps
+        self.clock = clock
+        self.is_idle = is_idle
+        self.next_deadline = next_deadline
+        self.is_throttled = is_throttled
+        self.throttle_ms = throttle_ms
+        self.budget_ms = budget_ms
+        self.monitor = LatencyMonitor(budget_ms, clock=clock)
+
+        self.accumulator = 0.0   # เวลาจริงที่ยังไม่ได้ simulate
+        self.game_time = 0.0     # เวลาเกมที่ simulate ไปแล้วทั้งหมด
+        self._second_acc = 0.0
+        self._last = None
+        self._running = False
+        self.sleeping = False
+        self._sleep_for = 0.0   # วินาทีที่ตั้งใจหลับครั้งล่าสุด (เพดานของ _advance_idle)
+        self._due = None        # เวลาที่ timer ควรปลุก (ใช้วัด lag ที่เกมเจอ)
+        self._deferred = {}     # key -> callable งานที่รอได้ (key ซ้ำ = ทำครั้งเดียว)
+
+        self.steps = 0
+        self.frames = 0
+        self.sleeps = 0
+        self.dropped_seconds = 0.0  # เวลาที่ทิ้งไปเพราะค้างเกิน max_steps
+        self.deferred_runs = 0
+        self.deferred_carried = 0   # ครั้งที่งบหมดแล้วยังมีงานค้างไปเฟรมถัดไป
+
+        # single-shot: ทุก tick ตั้งเวลาปลุกครั้งถัดไปเองใน _schedule()
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(QtCore.Qt.PreciseTimer)
+        self._timer.timeout.connect(self._on_timeout)
+
+    def is_running(self):
+        return self._running
+
+    def start(self):
+        """เริ่ม/เล่นต่อ — เวลาที่หยุดไปไม่ถูกนับ"""
+        if self._running:
+            return
+        self._running = True
+        self.sleeping = False
+        self._last = self.clock()
+        self._schedule()
+
+    def stop(self):
+        self._running = False
+        self.sleeping = False
+        self._timer.stop()
+        self._last = None
+        self._due = None
+        # หยุดแล้วไม่มี tick มาทำงานที่ค้าง — ทำให้หมดตอนนี้ (เช่น HUD ตอนหมดเวลา)
+        self.flush()
+
+    def defer(self, key, fn):
+        """ฝากงานที่รอได้ไว้ทำในเวลาที่เหลือของเฟรม
+
+        ฝาก key เดิมซ้ำก่อนถึงคิว = ทำครั้งเดียวด้วย fn ล่าสุด (เช่นคะแนนเปลี่ยนหลายครั้งในเฟรม
+        เดียว ตั้งข้อความ label ครั้งเดียว) ถ้า loop ไม่ได้วิ่งอยู่ ทำทันที
+        """
+        if not self._running:
+            fn()
+            return
+        self._deferred[key] = fn
+        if self.sleeping:
+            # ปลุกเร็วขึ้นให้งานนี้ได้ทำ แทนที่จะรอจนถึงวินาทีถัดไป
+            self._start_timer(1)
+
+    def flush(self):
+        """ทำงานที่ฝากไว้ทั้งหมดทันที ไม่สนงบเวลา"""
+        while self._deferred:
+            self._run_next_deferred()
+
+    def _run_next_deferred(self):
+        key = next(iter(self._deferred))
+        self._deferred.pop(key)()
+        self.deferred_runs += 1
+
+    def _run_deferred(self, deadline):
+        if not self._deferred:
+            return
+        self._run_next_deferred()
+        while self._deferred and self.clock() < deadline:
+            self._run_next_deferred()
+        if self._deferred:
+            self.deferred_carried += 1
+
+    def wake(self):
+        """มี input หรืองานใหม่ — เดินเวลาที่หลับไปแล้วตั้งเวลาปลุกใหม่ทันที
+
+        เรียกก่อนเปลี่ยนสถานะ input (เช่นก่อนเพิ่มปุ่มที่กด) เพื่อให้เวลาที่หลับไป
+        ถูก simulate ด้วยสถานะเดิม และเรียกอีกครั้งหลังเปลี่ยนเพื่อให้ loop เลือก
+        ระหว่าง tick ทุก step หรือหลับต่อจาก is_idle()/next_deadline() ใหม่
+        """
+        if self._running and self.sleeping:
+            # ตื่นเพราะ input ไม่ใช่ timer — ไม่นับเป็น lag
+            self._due = None
+            self.tick()
+
+    def reset_clock(self):
+        """เริ่มนับเวลาเกมใหม่ (ตอน restart)"""
+        self.accumulator = 0.0
+        self.game_time = 0.0
+        self._second_acc = 0.0
+        if self._last is not None:
+            self._last = self.clock()
+
+    def _on_timeout(self):
+        if self._due is not None:
+            self.monitor.record_wake(self.clock() - self._due)
+            self._due = None
+        self.tick()
+
+    def tick(self):
+        if not self._running:
+            return
+        with self.monitor.measure():
+            now = self.clock()
+            if self._last is None:
+                self._last = now
+            elapsed = now - self._last
+            self._last = now
+
+            if self.sleeping:
+                self._advance_idle(elapsed)
+            else:
+                self._advance_steps(elapsed)
+            self.frames += 1
+            # simulate/render ต้องทำทุกเฟรม งานที่รอได้ใช้เวลาที่เหลือของงบ
+            self._run_deferred(now + self.budget_ms / 1000.0)
+            self._schedule()
+
+    def _advance_idle(self, elapsed):
+        # ไม่มีอะไรขยับระหว่างหลับ — simulate เวลาที่หลับทั้งหมดในครั้งเดียว
+        # แต่ไม่เกินเวลาที่ตั้งใจหลับบวก max_steps (เช่น Maya ค้างนานระหว่างหลับ
+        # เกมต้องไม่กระโดดไปข้างหน้าหลายวินาที) ส่วนเกินนับเป็น dropped_seconds เหมือน _advance_steps
+        self.sleeping = False
+        self.accumulator = 0.0
+        limit = self._sleep_for + self.max_steps * self.step
+        if elapsed > limit:
+            self.dropped_seconds += elapsed - limit
+            elapsed = limit
+        if elapsed > 0:
+            self.simulate(elapsed)
+            self.steps += 1
+            self._advance_clock(elapsed)
+            if self.render is not None:
+                self.render()
+
+    def _advance_steps(self, elapsed):
+        self.accumulator += elapsed
+        step = self.step
+        ran = 0
+        while self.accumulator >= step and ran < self.max_steps:
+            self.simulate(step)
+            self.accumulator -= step
+            ran += 1
+            self._advance_clock(step)
+            if not self.is_running():
+                # simulate หรือ second หยุด loop (เช่นหมดเวลา)
+                break
+        if self.accumulator >= step:
+            self.dropped_seconds += self.accumulator
+            self.accumulator = 0.0
+
+        self.steps += ran
+        if ran and self.render is not None:
+            self.render()
+
+    def _schedule(self):
+        """ตั้งเวลาปลุกครั้งถัดไป: step ปกติ, tick ห่าง ๆ หรือหลับจนถึง deadline"""
+        if not self._running:
+            return
+        if self.is_idle is not None and self.is_idle():
+            # หลับจนถึงวินาทีถัดไปของนาฬิกาเกม หรือ deadline ของงาน ถ้ามาก่อน
+            wait = 1.0 - self._second_acc
+            deadline = self.next_deadline() if self.next_deadline is not None else None
+            if deadline is not None:
+                wait = min(wait, deadline)
+            if self._deferred:
+                # ยังมีงานค้างจากเฟรมนี้ — หลับแค่หนึ่ง step
+                wait = min(wait, self.step)
+            self.accumulator = 0.0
+            self.sleeping = True
+            self._sleep_for = wait
+            self.sleeps += 1
+            self._start_timer(max(1, int(math.ceil(wait * 1000))))
+            return
+        if self.is_throttled is not None and self.is_throttled():
+            self._start_timer(self.throttle_ms)
+        else:
+            self._start_timer(max(1, int(self.step * 1000)))
+
+    def _start_timer(self, ms):
+        self._due = self.clock() + ms / 1000.0
+        self._timer.start(ms)
+
+    def _advance_clock(self, dt):
+        self.game_time += dt
+        self._second_acc += dt
+        # 1e-9 กันเศษทศนิยมของ 0.016 * 62.5
+        while self._second_acc >= 1.0 - 1e-9:
+            self._second_acc -= 1.0
+            self.second.emit()
+
+    def stats(self):
+        return {
+            "steps": self.steps,
+            "frames": self.frames,
+            "sleeps": self.sleeps,
+            "game_time": self.game_time,
+            "dropped_seconds": self.dropped_seconds,
+            "deferred_runs": self.deferred_runs,
+            "deferred_carried": self.deferred_carried,
+            "budget_ms": self.budget_ms,
+            **self.monitor.stats(),
+        }
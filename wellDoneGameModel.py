@@ -0,0 +1,1376 @@
+"""Headless game model for Well Done! — ไม่มี Qt ในไฟล์นี้
+
+สถานะทั้งหมดของครัวอยู่ที่นี่เป็นพิกัดธรรมดา (ไม่อ่านจาก widget.geometry())
+widget ใน wellDoneGameUi เป็นแค่ view ที่ sync จาก Kitchen.take_changes()
+จึงรันกฎของเกมได้หลายพัน tick ต่อวินาทีในเทสต์หรือ batch job โดยไม่ต้องมีจอ
+"""
+import heapq
+import math
+import random
+from collections import deque
+
+try:
+    from . import wellDoneGameRecipes as wdrecipes
+except Exception:
+    import wellDoneGameRecipes as wdrecipes
+
+TICK_SECONDS = 0.016
+CHEF_SPEED = 500.0      # px ต่อวินาที (เท่ากับ 8 px ต่อ tick 16 ms)
+CHOP_SECONDS = 3.0
+POT_BATCH = 3           # ของชนิดเดียวกันครบ 3 ชิ้นในหม้อ = เริ่มต้ม
+# ขั้นของการต้มหนึ่งชุด (ชื่อขั้น, วินาที) — จบขั้นสุดท้ายแล้วของชุดนั้นออกจากหม้อ
+BOIL_STAGES = (("heating", 2.0), ("boiling", 4.0))
+
+PICK_RADIUS = 50        # หยิบวัตถุดิบ
+DROP_RADIUS = 50        # วางลงเขียง/หม้อ
+INTERACT_RADIUS = 80    # ถังขยะ จาน จุดเสิร์ฟ
+CHOP_RADIUS = 120       # หั่นของบนเขียง
+# resolve() ถามเฉพาะของในรัศมีนี้รอบเชฟ (รัศมีใหญ่สุดของทุก action)
+RESOLVE_RADIUS = max(PICK_RADIUS, DROP_RADIUS, INTERACT_RADIUS, CHOP_RADIUS)
+
+SPATIAL_CELL = 64       # ขนาดช่องของ SpatialHash (px) ≈ รัศมีหยิบของ
+
+ICON_SIZE = 40
+HELD_PLATE_SIZE = 64
+DROPPED_PLATE_SIZE = 60
+
+DEFAULT_ORDER_COMBOS = ["tomato_chopped", "lettuce_chopped", "cucamber_chopped"]
+ORDER_QUEUE = 3         # ออร์เดอร์ที่เปิดพร้อมกัน (ด่านยากตั้งใน LEVELS ได้)
+ORDER_SECONDS = 40.0    # เวลาก่อนออร์เดอร์หมดอายุ
+ORDER_POINTS = 20
+ORDER_TIP = 10          # ทิปสูงสุด (เสิร์ฟทันทีที่สั่ง) ลดลงตามเวลาที่เหลือ
+
+# ห้องครัวมาตรฐานหนึ่งห้อง: (ชนิด, ชื่อ, x, y, w, h)
+CLASSIC_ROOM = (
+    # เตา (stove)
+    ("station", "pot", 310, 154, 90, 106),
+    ("station", "chopping_board", 467, 185, 70, 50),
+    # จุดเสิร์ฟ (serve)
+    ("station", "serve_station", 1158, 163, 160, 229),
+    ("station", "plate_station", 1167, 353, 100, 85),
+    ("station", "trash_bin", 1045, 172, 90, 90),
+    # โต๊ะ (table)
+    ("decor", "table", 150, 500, 1240, 715),
+    # วัตถุดิบ (ingredients)
+    ("ingredient", "tomato", 920, 477, 80, 80),
+    ("ingredient", "lettuce", 853, 460, 90, 130),
+    ("ingredient", "cucamber", 980, 475, 90, 80),
+)
+CHEF_START = (200, 400)
+ROOM_PITCH = (1400, 1250)  # ระยะห่างระหว่างห้องในด่านหลายห้อง (โต๊ะยื่นเลยห้องลงไปด้านล่าง)
+
+# rooms = (คอลัมน์, แถว) ของห้องมาตรฐาน — ด่าน 1x1 ใช้ขนาดหน้าต่างเป็นขอบเขต
+LEVELS = {
+    "classic": {"rooms": (1, 1)},
+    "restaurant": {"rooms": (4, 3), "orders": 6, "order_seconds": 60.0},
+}
+
+
+class Entity:
+    """สิ่งของหนึ่งชิ้นในครัว: มุมซ้ายบน + ขนาด (แบบเดียวกับ QWidget.geometry())
+
+    ถ้ามี parent (เช่นของในมือเชฟ) x, y เป็น offset จาก parent และไม่ต้องอัปเดตตอนแม่เดิน
+    """
+    __slots__ = ("kind", "name", "sprite", "x", "y", "w", "h", "parent")
+
+    def __init__(self, kind, name, x, y, w, h, sprite=None):
+        self.kind = kind
+        self.name = name
+        self.sprite = sprite if sprite is not None else name
+        self.x = x
+        self.y = y
+        self.w = w
+        self.h = h
+        self.parent = None
+
+    def world_pos(self):
+        if self.parent is None:
+            return (self.x, self.y)
+        px, py = self.parent.world_pos()
+        return (px + self.x, py + self.y)
+
+    def center(self):
+        return (self.x + self.w // 2, self.y + self.h // 2)
+
+    def __repr__(self):
+        return f"<{type(self).__name__} {self.kind}:{self.name} @({self.x:.0f},{self.y:.0f})>"
+
+
+class Item(Entity):
+    """วัตถุดิบที่ถืออยู่หรือวางอยู่ (station = เขียง/หม้อที่วางอยู่ หรือ None ถ้าอยู่บนพื้น)
+
+    id คือ id ใน RecipeBook — name/sprite เป็นค่าของ id นั้นที่ compile ไว้แล้ว
+    (สร้างผ่าน Kitchen._new_item())
+    """
+    __slots__ = ("id", "station")
+
+    def __init__(self, kind, item_id, name, sprite, x, y, w=ICON_SIZE, h=ICON_SIZE, station=None):
+        super().__init__(kind, name, x, y, w, h, sprite=sprite)
+        self.id = item_id
+        self.station = station
+
+
+class Plate(Entity):
+    """จานหนึ่งใบ — บน plate_station, ในมือเชฟ, บนพื้น จนถึงจุดเสิร์ฟเป็น object เดิม
+    (หยิบ/วาง/เสิร์ฟแค่เปลี่ยน kind ขนาด และที่อยู่ ไม่ copy ของบนจาน)
+
+    items คือ id ตามลำดับที่ใส่ และ key คือ RecipeKey ของชุดที่อัปเดตทีละชิ้นใน add()
+    — เทียบกับออร์เดอร์ได้ด้วย hash ที่เก็บไว้แล้ว
+    """
+    __slots__ = ("items", "key")
+
+    def __init__(self, kind, x, y, w, h, key, sprite="plate"):
+        super().__init__(kind, "plate", x, y, w, h, sprite=sprite)
+        self.items = []
+        self.key = key
+
+    def add(self, item_id, book):
+        """ใส่ของหนึ่งชิ้น (book คือ RecipeBook) แล้วอัปเดต key และภาพของจาน"""
+        self.items.append(item_id)
+        self.key = book.extend(self.key, item_id)
+        self.sprite = book.plate_sprite(self.key)
+        return self.items
+
+
+class Station(Entity):
+    """เตา เขียง ถังขยะ จุดเสิร์ฟ ฯลฯ — contents คือของที่อยู่บน station
+
+    contents เป็น list ตามลำดับที่วาง ยกเว้น Pot ที่ใช้ dict (ordered set) เพราะเอาของ
+    ออกทีละชุดจากกลางหม้อ — ผู้ใช้ทั่วไปแค่วนลูป/เช็ก in/len ซึ่งใช้ได้ทั้งสองแบบ
+    """
+    __slots__ = ("contents",)
+
+    def __init__(self, kind, x, y, w, h, sprite=None):
+        super().__init__(kind, kind, x, y, w, h, sprite=sprite)
+        self.contents = []
+
+
+class PlateStation(Station):
+    """ที่วางจาน: plate คือจานใบบนสุด (ไม่ได้วาดแยก ภาพของ station เป็นภาพจานนั้น)"""
+    __slots__ = ("plate",)
+
+    def __init__(self, kind, x, y, w, h, sprite=None):
+        super().__init__(kind, x, y, w, h, sprite=sprite)
+        self.plate = None
+
+
+class Pot(Station):
+    """หม้อ: เก็บ icon ของวัตถุดิบแต่ละชนิดแยกกัน
+
+    contents เป็น dict (ordered set) ของ Item ทุกชิ้นในหม้อ waiting คือ icon ต่อ id
+    ที่ยังไม่ครบชุด (ความยาวของคิวคือจำนวนที่รออยู่) ครบ POT_BATCH ชิ้นเมื่อไรจะแยก
+    ออกเป็น Batch ที่ต้มต่อไปตาม BOIL_STAGES — หม้อเดียวต้มได้หลายชุดพร้อมกัน
+    """
+    __slots__ = ("waiting", "batches")
+
+    def __init__(self, kind, x, y, w, h, sprite=None):
+        super().__init__(kind, x, y, w, h, sprite=sprite)
+        self.clear()
+
+    def clear(self):
+        self.contents = {}
+        self.waiting = {}    # id -> deque ของ Item
+        self.batches = {}    # ordered set ของ Batch ที่กำลังต้ม
+
+    def add(self, item):
+        """ใส่ของหนึ่งชิ้น คืน Batch ถ้าของชนิดนี้ครบชุดพอดี ไม่งั้น None"""
+        item_id = item.id
+        self.contents[item] = None
+        waiting = self.waiting.get(item_id)
+        if waiting is None:
+            waiting = self.waiting[item_id] = deque()
+        waiting.append(item)
+        if len(waiting) < POT_BATCH:
+            return None
+        batch = Batch(self, item_id, [waiting.popleft() for _ in range(POT_BATCH)])
+        if not waiting:
+            del self.waiting[item_id]
+        self.batches[batch] = None
+        return batch
+
+    def take(self, batch):
+        """ต้มเสร็จ: เอาของของชุดนี้ (และเฉพาะชุดนี้) ออกจากหม้อ"""
+        del self.batches[batch]
+        for item in batch.items:
+            del self.contents[item]
+        return batch.items
+
+
+class Batch:
+    """ของชนิดเดียวกันครบชุดในหม้อที่กำลังต้ม (stage เป็น index ใน BOIL_STAGES)"""
+    __slots__ = ("pot", "item_id", "items", "stage")
+
+    def __init__(self, pot, item_id, items):
+        self.pot = pot
+        self.item_id = item_id
+        self.items = items
+        self.stage = 0
+
+    def __repr__(self):
+        return f"Batch({self.items[0].name} x{len(self.items)}, {BOIL_STAGES[self.stage][0]})"
+
+
+class Chef(Entity):
+    __slots__ = ("speed", "held", "plate")
+
+    def __init__(self, x, y, w=111, h=133, speed=CHEF_SPEED):
+        super().__init__("chef", "chef", x, y, w, h)
+        self.speed = speed
+        self.held = None   # Item ที่ถืออยู่
+        self.plate = None  # Plate ที่ถืออยู่
+
+
+def distance_sq(a, b):
+    ax, ay = a.center()
+    bx, by = b.center()
+    return (ax - bx) ** 2 + (ay - by) ** 2
+
+
+def is_near(a, b, threshold=INTERACT_RADIUS, mode="center"):
+    """a อยู่ใกล้ b ไหม
+
+    mode:
+        - "center" : วัดระยะจากจุดศูนย์กลาง (เหมาะกับ station ทั่วไป)
+        - "bounds" : วัดจากขอบของ bounding box
+    """
+    if a is None or b is None:
+        return False
+
+    if mode == "center":
+        ax, ay = a.x + a.w / 2, a.y + a.h / 2
+        bx, by = b.x + b.w / 2, b.y + b.h / 2
+        return (ax - bx) ** 2 + (ay - by) ** 2 < threshold ** 2
+
+    if mode == "bounds":
+        dx = max(b.x - (a.x + a.w - 1), a.x - (b.x + b.w - 1), 0)
+        dy = max(b.y - (a.y + a.h - 1), a.y - (b.y + b.h - 1), 0)
+        return dx ** 2 + dy ** 2 < threshold ** 2
+
+    raise ValueError("mode ต้องเป็น 'center' หรือ 'bounds'")
+
+
+class SpatialHash:
+    """Uniform grid ของ entity ตามจุดศูนย์กลาง ใช้หาของใกล้ ๆ โดยไม่ต้องไล่ทุกชิ้น
+
+    query ตรวจเฉพาะช่องที่วงกลมคาบเกี่ยวและเทียบระยะกำลังสอง (ไม่มี sqrt)
+    ของที่ย้ายที่ต้องเรียก move() ไม่งั้นตำแหน่งใน index จะเป็นของเก่า
+    """
+    __slots__ = ("cell", "cells", "where", "max_half")
+
+    def __init__(self, cell=SPATIAL_CELL):
+        self.cell = cell
+        self.cells = {}   # (cx, cy) -> {entity: (x, y) ของจุดศูนย์กลาง}
+        self.where = {}   # entity -> (cx, cy)
+        self.max_half = (0.0, 0.0)  # ครึ่งกว้าง/สูงที่ใหญ่สุดที่เคยใส่ (ใช้ใน nearest_per_kind)
+
+    def __len__(self):
+        return len(self.where)
+
+    def __contains__(self, entity):
+        return entity in self.where
+
+    def _key(self, x, y):
+        return (int(x // self.cell), int(y // self.cell))
+
+    def insert(self, entity):
+        """เพิ่ม entity หรืออัปเดตตำแหน่งถ้ามีอยู่แล้ว"""
+        x, y = entity.center()
+        key = self._key(x, y)
+        max_w, max_h = self.max_half
+        if entity.w / 2 > max_w or entity.h / 2 > max_h:
+            self.max_half = (max(max_w, entity.w / 2), max(max_h, entity.h / 2))
+        old = self.where.get(entity)
+        if old is not None and old != key:
+            self._discard(entity, old)
+        self.cells.setdefault(key, {})[entity] = (x, y)
+        self.where[entity] = key
+
+    move = insert
+
+    def remove(self, entity):
+        key = self.where.pop(entity, None)
+        if key is not None:
+            self._discard(entity, key)
+
+    def _discard(self, entity, key):
+        bucket = self.cells[key]
+        del bucket[entity]
+        if not bucket:
+            del self.cells[key]
+
+    def clear(self):
+        self.cells.clear()
+        self.where.clear()
+        self.max_half = (0.0, 0.0)
+
+    def _span(self, x, y, radius):
+        x0, y0 = self._key(x - radius, y - radius)
+        x1, y1 = self._key(x + radius, y + radius)
+        return x0, y0, x1, y1, (x1 - x0 + 1) * (y1 - y0 + 1)
+
+    def query(self, x, y, radius, kinds=None):
+        """entity ที่จุดศูนย์กลางห่างจาก (x, y) ไม่เกิน radius
+
+        คืน list ของ (ระยะกำลังสอง, entity) เรียงจากใกล้ไปไกล
+        kinds: กรองตาม entity.kind (tuple/set) หรือ None = ทุกชนิด
+        """
+        limit = radius * radius
+        x0, y0, x1, y1, count = self._span(x, y, radius)
+        cells = self.cells
+        if count > len(cells):
+            # วงกว้างกว่าจำนวนช่องที่มีของ — ไล่ทุกช่องที่มีของถูกกว่า
+            buckets = cells.values()
+        else:
+            buckets = [cells[key] for key in
+                       ((cx, cy) for cx in range(x0, x1 + 1) for cy in range(y0, y1 + 1))
+                       if key in cells]
+
+        return self._collect(buckets, x, y, limit, kinds)
+
+    @staticmethod
+    def _collect(buckets, x, y, limit, kinds):
+        found = []
+        for bucket in buckets:
+            for entity, (ex, ey) in bucket.items():
+                if kinds is not None and entity.kind not in kinds:
+                    continue
+                d2 = (ex - x) ** 2 + (ey - y) ** 2
+                if limit is None or d2 <= limit:
+                    found.append((d2, entity))
+        found.sort(key=lambda pair: pair[0])
+        return found
+
+    def nearest(self, x, y, k=1, radius=None, kinds=None):
+        """k entity ที่ใกล้ (x, y) ที่สุด (ภายใน radius ถ้ากำหนด) เป็น list ของ (ระยะกำลังสอง, entity)"""
+        if radius is not None:
+            return self.query(x, y, radius, kinds)[:k]
+        # ขยายวงทีละเท่าจนเจอครบ k ถ้าวงกว้างกว่าจำนวนช่องที่มีของแล้วก็ไล่ทั้งหมดทีเดียว
+        radius = self.cell
+        while self._span(x, y, radius)[4] <= len(self.cells):
+            found = self.query(x, y, radius, kinds)
+            if len(found) >= k:
+                return found[:k]
+            radius *= 2
+        return self._collect(self.cells.values(), x, y, None, kinds)[:k]
+
+    def nearest_per_kind(self, x, y, radius, half_w=0.0, half_h=0.0):
+        """ชิ้นที่ใกล้ (x, y) ที่สุดของแต่ละ kind ในบริเวณรอบ ๆ จุดนั้น
+
+        คืน {kind: (ระยะกำลังสองจากจุดศูนย์กลาง, ระยะกำลังสองจากขอบ, entity)}
+        ระยะจากขอบวัดระหว่างกล่องขนาด half_w x half_h รอบ (x, y) กับกล่องของ entity
+
+        ถามเฉพาะช่องในวง radius ที่ขยายด้วยครึ่งขนาดของกล่องที่ใหญ่ที่สุด — ของที่ไม่อยู่
+        ในวงนี้ไม่มีทางอยู่ในระยะ radius ไม่ว่าจะวัดจากจุดศูนย์กลางหรือจากขอบ
+        ต้นทุนจึงขึ้นกับของรอบตัว ไม่ใช่ขนาดด่าน
+        """
+        max_w, max_h = self.max_half
+        reach = radius + math.hypot(half_w + max_w, half_h + max_h)
+        best = {}
+        for d2, entity in self.query(x, y, reach):
+            kind = entity.kind
+            if kind in best:
+                continue
+            cx, cy = entity.center()
+            gx = max(abs(cx - x) - entity.w / 2 - half_w, 0)
+            gy = max(abs(cy - y) - entity.h / 2 - half_h, 0)
+            best[kind] = (d2, gx * gx + gy * gy, entity)
+        return best
+
+
+def within(near, kind, radius, mode="center"):
+    """entity ใกล้สุดของ kind จากผลของ nearest_per_kind() ถ้าอยู่ในรัศมี ไม่งั้น None"""
+    found = near.get(kind)
+    if found is None:
+        return None
+    d2 = found[0] if mode == "center" else found[1]
+    return found[2] if d2 < radius * radius else None
+
+
+class Resolution:
+    """คำตอบของ Kitchen.resolve(): แต่ละปุ่มจะทำอะไร กับอะไร
+
+    use/drop/chop เป็น (ชื่อ action, เป้าหมาย) — เป้าหมายเป็น entity หรือ None
+    target คือของที่ควรไฮไลต์ (เป้าหมายของปุ่ม use ถ้ามี ไม่งั้นของที่หั่นได้)
+    """
+    __slots__ = ("revision", "use", "drop", "chop", "target")
+
+    def __init__(self, revision, use, drop, chop):
+        self.revision = revision
+        self.use = use
+        self.drop = drop
+        self.chop = chop
+        self.target = use[1] if use[1] is not None else chop[1]
+
+    def action(self, slot):
+        return getattr(self, slot)
+
+
+class Job:
+    """งานที่ใช้เวลาหนึ่งชิ้น (เช่นหั่นของบนเขียง) ของ JobScheduler
+
+    owner คือ station ที่งานอยู่ target คือของที่ถูกทำ (หนึ่งงานต่อ target)
+    """
+    __slots__ = ("kind", "owner", "target", "start", "due", "seq", "cancelled")
+
+    def __init__(self, kind, owner, target, start, due, seq):
+        self.kind = kind
+        self.owner = owner
+        self.target = target
+        self.start = start
+        self.due = due
+        self.seq = seq
+        self.cancelled = False
+
+    def __lt__(self, other):
+        return (self.due, self.seq) < (other.due, other.seq)
+
+    def progress(self, now):
+        """0.0 ถึง 1.0 สำหรับ progress bar"""
+        length = self.due - self.start
+        if length <= 0:
+            return 1.0
+        return max(0.0, min(1.0, (now - self.start) / length))
+
+    def __repr__(self):
+        return f"Job({self.kind}, {self.target!r}, due={self.due:.3f})"
+
+
+class JobScheduler:
+    """งานที่ใช้เวลาทั้งครัวใน heap เดียว เรียงตามเวลาเสร็จ (เวลาเกม ไม่ใช่เวลาจริง)
+
+    ไม่มี timer ต่องาน — Kitchen.step(dt) เรียก advance(dt) และ GameLoop ตัวเดียวปลุก
+    ตาม next_due() จึงมีงานพร้อมกันได้หลายสิบงานโดยต้นทุนต่อ tick คงที่
+    ยกเลิกงานใช้ lazy deletion (ทำเครื่องหมายไว้ ทิ้งตอนขึ้นมาถึงหัว heap)
+    """
+
+    def __init__(self):
+        self.now = 0.0
+        self.paused = False
+        self._heap = []
+        self._seq = 0
+        self._by_target = {}  # target -> Job
+        self._by_owner = {}   # owner -> {Job: None}
+        self._cancelled = 0   # งานที่ยกเลิกแล้วแต่ยังค้างใน heap
+
+    def __len__(self):
+        return len(self._by_target)
+
+    def __contains__(self, target):
+        return target in self._by_target
+
+    def schedule(self, kind, owner, target, duration):
+        """เริ่มงาน kind กับ target (ถ้า target มีงานอยู่แล้ว งานเดิมถูกยกเลิก)"""
+        self.cancel(target)
+        self._seq += 1
+        job = Job(kind, owner, target, self.now, self.now + duration, self._seq)
+        heapq.heappush(self._heap, job)
+        self._by_target[target] = job
+        self._by_owner.setdefault(owner, {})[job] = None
+        return job
+
+    def job_for(self, target):
+        return self._by_target.get(target)
+
+    def jobs_at(self, owner):
+        """งานที่กำลังทำอยู่ที่ station owner"""
+        return list(self._by_owner.get(owner, ()))
+
+    def progress(self, target):
+        """ความคืบหน้า 0.0–1.0 ของงานของ target (None ถ้าไม่มีงาน)"""
+        job = self._by_target.get(target)
+        return job.progress(self.now) if job is not None else None
+
+    def cancel(self, target):
+        """ยกเลิกงานของ target คืน Job ที่ถูกยกเลิกหรือ None"""
+        job = self._by_target.get(target)
+        if job is None:
+            return None
+        self._forget(job)
+        job.cancelled = True
+        self._cancelled += 1
+        if self._cancelled > 32 and self._cancelled * 2 > len(self._heap):
+            self._heap = [j for j in self._heap if not j.cancelled]
+            heapq.heapify(self._heap)
+            self._cancelled = 0
+        return job
+
+    def cancel_owner(self, owner):
+        return [self.cancel(job.target) for job in self.jobs_at(owner)]
+
+    def cancel_all(self):
+        """ยกเลิกทุกงาน (ตอน restart)"""
+        for job in self._heap:
+            job.cancelled = True
+        self._heap = []
+        self._by_target = {}
+        self._by_owner = {}
+        self._cancelled = 0
+
+    def pause(self):
+        self.paused = True
+
+    def resume(self):
+        self.paused = False
+
+    def next_due(self):
+        """วินาทีจนถึงงานถัดไปจะเสร็จ (None ถ้าไม่มีงานหรือหยุดอยู่)"""
+        if self.paused:
+            return None
+        heap = self._heap
+        while heap and heap[0].cancelled:
+            heapq.heappop(heap)
+            self._cancelled -= 1
+        return max(0.0, heap[0].due - self.now) if heap else None
+
+    def advance(self, dt):
+        """เดินเวลา dt คืน list ของ Job ที่เสร็จ เรียงตามเวลาเสร็จ"""
+        if self.paused:
+            return []
+        self.now += dt
+        done = []
+        heap = self._heap
+        # 1e-9 กันเศษทศนิยมของ dt สะสม (เช่น 0.016 * 187.5)
+        while heap and heap[0].due <= self.now + 1e-9:
+            job = heapq.heappop(heap)
+            if job.cancelled:
+                self._cancelled -= 1
+                continue
+            self._forget(job)
+            done.append(job)
+        return done
+
+    def _forget(self, job):
+        del self._by_target[job.target]
+        owned = self._by_owner.get(job.owner)
+        if owned is not None:
+            owned.pop(job, None)
+            if not owned:
+                del self._by_owner[job.owner]
+
+
+class Order:
+    """ออร์เดอร์หนึ่งใบ: key คือ RecipeKey ของจานที่สั่ง หมดอายุที่ due (เวลาเกม)"""
+    __slots__ = ("key", "placed", "due", "seq", "open")
+
+    def __init__(self, key, placed, due, seq):
+        self.key = key
+        self.placed = placed
+        self.due = due
+        self.seq = seq
+        self.open = True
+
+    def __lt__(self, other):
+        return (self.due, self.seq) < (other.due, other.seq)
+
+    def remaining(self, now):
+        return max(0.0, self.due - now)
+
+    def __repr__(self):
+        return f"Order({self.key!r}, due={self.due:.1f})"
+
+
+class OrderBook:
+    """ออร์เดอร์ที่เปิดอยู่ทั้งหมด (วนใน for ได้ตามลำดับที่สั่ง)
+
+    deadline อยู่ใน heap — advance(dt) ปิดใบที่หมดอายุ (คืนให้ Kitchen.step ส่งเป็น event) แล้วสั่งใหม่
+    แทนจาก rng ของครัว (seed เดียวกัน = ออร์เดอร์ชุดเดียวกัน) และ dict RecipeKey -> deque
+    ของใบที่เปิดอยู่ (เก่าสุดก่อน) ทำให้จานที่เสิร์ฟจับคู่กับใบไหนก็ได้ใน O(1)
+    ใบที่ปิดแล้วถูกทิ้งจาก heap ตอนขึ้นมาถึงหัว (lazy deletion)
+    """
+
+    def __init__(self, keys, rng, size=ORDER_QUEUE, lifetime=ORDER_SECONDS):
+        self.keys = list(keys)
+        self.rng = rng
+        self.size = size
+        self.lifetime = lifetime
+        self.now = 0.0
+        self._seq = 0
+        self._heap = []
+        self._by_key = {}   # RecipeKey -> deque ของ Order
+        self._open = {}     # ordered set ของ Order ที่เปิดอยู่
+
+    def __len__(self):
+        return len(self._open)
+
+    def __iter__(self):
+        return iter(list(self._open))
+
+    def reset(self):
+        self.now = 0.0
+        self._heap = []
+        self._by_key = {}
+        self._open = {}
+        self.fill()
+
+    def fill(self):
+        while len(self._open) < self.size and self.keys:
+            self.place(self.rng.choice(self.keys))
+
+    def place(self, key):
+        self._seq += 1
+        order = Order(key, self.now, self.now + self.lifetime, self._seq)
+        heapq.heappush(self._heap, order)
+        queue = self._by_key.get(key)
+        if queue is None:
+            queue = self._by_key[key] = deque()
+        queue.append(order)
+        self._open[order] = None
+        return order
+
+    def match(self, key):
+        """ใบที่เปิดอยู่ซึ่งตรงกับ key (ใบที่สั่งก่อน = ใกล้หมดอายุที่สุด) หรือ None"""
+        queue = self._by_key.get(key)
+        if queue is None:
+            return None
+        while queue and not queue[0].open:
+            queue.popleft()
+        if not queue:
+            del self._by_key[key]
+            return None
+        return queue[0]
+
+    def tip(self, order):
+        length = order.due - order.placed
+        if length <= 0:
+            return 0
+        return int(round(ORDER_TIP * order.remaining(self.now) / length))
+
+    def serve(self, key):
+        """ปิดใบที่ตรงกับ key แล้วสั่งใบใหม่แทน คืน (order, ทิป) หรือ (None, 0)"""
+        order = self.match(key)
+        if order is None:
+            return None, 0
+        tip = self.tip(order)
+        self._close(order)
+        self.fill()
+        return order, tip
+
+    def _close(self, order):
+        order.open = False
+        del self._open[order]
+        queue = self._by_key.get(order.key)
+        if queue and queue[0] is order:
+            queue.popleft()
+            if not queue:
+                del self._by_key[order.key]
+
+    def next_due(self):
+        """วินาทีจนถึงออร์เดอร์ถัดไปจะหมดอายุ (None ถ้าไม่มี)"""
+        heap = self._heap
+        while heap and not heap[0].open:
+            heapq.heappop(heap)
+        return max(0.0, heap[0].due - self.now) if heap else None
+
+    def advance(self, dt):
+        """เดินเวลา dt คืน list ของใบที่หมดอายุ (สั่งใบใหม่แทนแล้ว)"""
+        self.now += dt
+        expired = []
+        heap = self._heap
+        while heap and heap[0].due <= self.now + 1e-9:
+            order = heapq.heappop(heap)
+            if not order.open:
+                continue
+            self._close(order)
+            expired.append(order)
+        if expired:
+            self.fill()
+        return expired
+
+
+STATION_TYPES = {"pot": Pot, "plate_station": PlateStation}
+
+
+def build_level(kitchen, name="classic"):
+    """วางห้องครัวตามด่าน name ลงใน kitchen และวางเชฟที่ห้องแรก
+
+    คืนขนาดโลก (w, h) สำหรับด่านหลายห้อง หรือ None ถ้าด่านมีห้องเดียว
+    (ขอบเขตเดินได้ตามขนาด widget เหมือนเดิม)
+    """
+    level = LEVELS[name]
+    cols, rows = level["rooms"]
+    pitch_x, pitch_y = ROOM_PITCH
+    builders = {
+        "station": kitchen.add_station,
+        "decor": kitchen.add_decor,
+        "ingredient": kitchen.add_ingredient,
+    }
+    for row in range(rows):
+        for col in range(cols):
+            ox, oy = col * pitch_x, row * pitch_y
+            for kind, thing, x, y, w, h in CLASSIC_ROOM:
+                builders[kind](thing, ox + x, oy + y, w, h)
+    kitchen.add_chef(*CHEF_START)
+    # ด่านใหญ่มีออร์เดอร์เปิดพร้อมกันมากขึ้น (มีผลตอน Kitchen.reset())
+    kitchen.orders.size = level.get("orders", ORDER_QUEUE)
+    kitchen.orders.lifetime = level.get("order_seconds", ORDER_SECONDS)
+
+    if cols * rows == 1:
+        return None
+    size = (cols * pitch_x, rows * pitch_y)
+    kitchen.resize(*size)
+    return size
+
+
+class Kitchen:
+    """สถานะของครัวหนึ่งห้องและกฎของเกมทั้งหมด
+
+    ทุกเมธอดที่เปลี่ยนสถานะจะบันทึก entity ที่เปลี่ยน/ถูกลบไว้ ให้ view
+    ดึงไปด้วย take_changes() แล้วอัปเดตเฉพาะส่วนนั้น
+    """
+
+    def __init__(self, width=1200, height=675, has_sprite=None, order_combos=None, seed=None):
+        self.width = width
+        self.height = height
+        # ถามว่ามีภาพ sprite นี้ไหม (view ส่ง manifest.has มาให้) — headless ถือว่ามีทุกภาพ
+        self.has_sprite = has_sprite or (lambda name: True)
+        self.order_combos = list(order_combos or DEFAULT_ORDER_COMBOS)
+        # ชื่อของทุกสถานะ -> id จำนวนเต็ม (compile ครั้งเดียว) ออร์เดอร์เก็บเป็น key ของ id
+        self.recipes = wdrecipes.compile_recipes(has_sprite=self.has_sprite)
+        self.order_keys = [key for key in map(self.recipes.parse_combo, self.order_combos) if key]
+        if not self.order_keys:
+            self.order_keys = [self.recipes.parse_combo(combo) for combo in DEFAULT_ORDER_COMBOS]
+        self.rng = random.Random(seed)
+
+        self.entities = []   # ของที่อยู่ตลอดเกม (station, วัตถุดิบต้นทาง, ของตกแต่ง)
+        self.stations = {}   # kind -> [Station]
+        self.ingredients = []
+        self.chef = None
+        self.index = SpatialHash()  # ของที่โต้ตอบได้ทั้งหมด (ไม่รวมเชฟและของในมือ)
+
+        self._dirty = {}     # ใช้ dict เป็น ordered set เพื่อรักษาลำดับการวาด
+        self._removed = []
+        self.revision = 0       # เพิ่มทุกครั้งที่มีอะไรเปลี่ยน (รวมเชฟเดิน)
+        self._resolved = None   # Resolution ล่าสุด ใช้ซ้ำจนกว่า revision จะเปลี่ยน
+
+        self.floor_items = {}     # ordered set ของ Item บนพื้น
+        self.dropped_plates = {}  # ordered set ของ Plate บนพื้น
+        self.jobs = JobScheduler()  # งานที่ใช้เวลาทั้งครัว (หั่น ...)
+        self._job_handlers = {"chop": self._finish_chop, "boil": self._advance_boil}
+        self.score = 0
+        self.orders = OrderBook(self.order_keys, self.rng)
+        self.remaining_time = 0
+
+    # ------------------- สร้างฉาก -------------------
+    def add_station(self, kind, x, y, w, h, sprite=None):
+        station = STATION_TYPES.get(kind, Station)(kind, x, y, w, h, sprite)
+        if isinstance(station, PlateStation):
+            station.plate = self._new_plate()
+        self.stations.setdefault(kind, []).append(station)
+        self.entities.append(station)
+        self._place(station)
+        return station
+
+    def add_decor(self, name, x, y, w, h, sprite=None):
+        decor = Entity("decor", name, x, y, w, h, sprite)
+        self.entities.append(decor)
+        self.mark_dirty(decor)
+        return decor
+
+    def add_ingredient(self, name, x, y, w, h, sprite=None):
+        raw_id = self.recipes.add_ingredient(name)
+        source = Item("ingredient", raw_id, name, sprite or name, x, y, w, h)
+        self.ingredients.append(source)
+        self.entities.append(source)
+        self._place(source)
+        return source
+
+    def add_chef(self, x, y, w=111, h=133):
+        self.chef = Chef(x, y, w, h)
+        self.mark_dirty(self.chef)
+        return self.chef
+
+    def station(self, kind):
+        """station แรกของชนิดนี้ (None ถ้าไม่มี)"""
+        found = self.stations.get(kind)
+        return found[0] if found else None
+
+    def station_near(self, kind, threshold=INTERACT_RADIUS, mode="center", entity=None):
+        """station ชนิด kind ที่ใกล้ entity (ค่าเริ่มต้นคือเชฟ) ที่สุดภายในระยะ (None ถ้าไม่มี)
+
+        ด่านหลายห้องมี station ชนิดเดียวกันหลายอัน — ใช้อันนี้แทน station(kind)
+        """
+        entity = entity or self.chef
+        if mode == "center":
+            return self.nearest(entity, threshold, (kind,))
+        best, best_d2 = None, None
+        for station in self.stations.get(kind, ()):
+            if is_near(entity, station, threshold, mode):
+                d2 = distance_sq(entity, station)
+                if best is None or d2 < best_d2:
+                    best, best_d2 = station, d2
+        return best
+
+    def resize(self, width, height):
+        self.width = width
+        self.height = height
+
+    def reset(self, remaining_time=120):
+        """ล้างของทั้งหมดที่เกิดระหว่างเล่น เริ่มเกมใหม่"""
+        for item in self.floor_items:
+            self._unplace(item)
+        for plate in self.dropped_plates:
+            self._unplace(plate)
+        self.floor_items = {}
+        self.dropped_plates = {}
+
+        for stations in self.stations.values():
+            for station in stations:
+                if isinstance(station, PlateStation) and station.plate.items:
+                    station.plate = self._new_plate()
+                    station.sprite = station.plate.sprite
+                    self.mark_dirty(station)
+                for thing in station.contents:
+                    if isinstance(thing, Entity):
+                        self._unplace(thing)
+                if isinstance(station, Pot):
+                    station.clear()
+                else:
+                    station.contents = []
+
+        if self.chef is not None:
+            self._release_held()
+            if self.chef.plate is not None:
+                self.mark_removed(self.chef.plate)
+                self.chef.plate = None
+
+        # งานที่ค้างอยู่ทั้งหมด (เช่นหั่นค้าง) ถูกยกเลิกพร้อมกัน
+        self.jobs.cancel_all()
+        self.jobs.resume()
+        self.score = 0
+        self.remaining_time = remaining_time
+        self.orders.reset()
+
+    # ------------------- view sync -------------------
+    def mark_dirty(self, entity):
+        self._dirty[entity] = None
+        self.revision += 1
+
+    def mark_removed(self, entity):
+        self._dirty.pop(entity, None)
+        self._removed.append(entity)
+        self.revision += 1
+
+    def _place(self, entity):
+        """ของถูกวาง/ย้ายในครัว: อัปเดต index และบอก view"""
+        self.index.insert(entity)
+        self.mark_dirty(entity)
+
+    def _unplace(self, entity):
+        self.index.remove(entity)
+        self.mark_removed(entity)
+
+    def near(self, entity, radius, kinds):
+        """ของชนิด kinds ที่อยู่ในรัศมีจากจุดศูนย์กลางของ entity — [(ระยะกำลังสอง, ของ)] ใกล้สุดก่อน"""
+        x, y = entity.center()
+        return self.index.query(x, y, radius, kinds)
+
+    def nearest(self, entity, radius, kinds):
+        """ของชนิด kinds ที่ใกล้ entity ที่สุดภายในรัศมี (None ถ้าไม่มี)"""
+        found = self.near(entity, radius, kinds)
+        return found[0][1] if found else None
+
+    def _still_near(self, target, kinds, radius, mode="center"):
+        """เป้าหมายจาก resolve() ยังใช้ได้ไหม (ยังอยู่ในครัว เป็นชนิดที่ต้องการ และอยู่ในระยะของเชฟ)
+
+        action ที่ได้เป้าหมายมาแล้วเช็กแค่นี้แทนการ query SpatialHash ซ้ำ — ถ้าไม่ผ่าน
+        (None หรือของเปลี่ยนไปแล้ว) ค่อย query ใหม่
+        """
+        return (target is not None and target.kind in kinds and target in self.index
+                and is_near(self.chef, target, radius, mode))
+
+    def surroundings(self, entity=None):
+        """ของใกล้สุดทุกชนิดรอบ entity (ค่าเริ่มต้นคือเชฟ) ภายใน RESOLVE_RADIUS
+
+        ดู SpatialHash.nearest_per_kind — ถามแค่ช่องรอบ entity จึงเรียกได้ทุก tick ที่เชฟเดิน
+        """
+        entity = entity or self.chef
+        return self.index.nearest_per_kind(entity.x + entity.w / 2, entity.y + entity.h / 2,
+                                           RESOLVE_RADIUS, entity.w / 2, entity.h / 2)
+
+    def resolve(self):
+        """เชฟอยู่ใกล้อะไร และแต่ละปุ่มจะทำอะไร — คำนวณใหม่เฉพาะเมื่อ revision เปลี่ยน
+
+        ลำดับความสำคัญเหมือนเงื่อนไขเดิมใน GameWidget.keyPressEvent
+        """
+        resolved = self._resolved
+        if resolved is not None and resolved.revision == self.revision:
+            return resolved
+
+        chef = self.chef
+        near = self.surroundings()
+        trash = within(near, "trash_bin", INTERACT_RADIUS)
+        plate = within(near, "plate", INTERACT_RADIUS)
+
+        # ----- ปุ่ม use (F) -----
+        if chef.held is not None:
+            station = within(near, "plate_station", INTERACT_RADIUS)
+            if trash is not None:
+                use = ("trash_item", trash)
+            elif station is not None:
+                use = ("plate_station", station)
+            elif plate is not None:
+                use = ("dropped_plate", plate)
+            elif chef.plate is not None:
+                use = ("held_plate", None)
+            else:
+                use = ("drop_item", self._drop_target(near))
+        elif chef.plate is not None:
+            if trash is not None:
+                use = ("trash_plate", trash)
+            else:
+                use = ("serve", within(near, "serve_station", INTERACT_RADIUS))
+        else:
+            # จานมี priority สูงกว่าวัตถุดิบ
+            station = within(near, "plate_station", INTERACT_RADIUS, mode="bounds")
+            if station is not None or plate is not None:
+                use = ("pickup_plate", station or plate)
+            else:
+                use = ("pick_item", self._pick_target(near))
+
+        # ----- ปุ่ม drop (G) -----
+        if chef.plate is not None:
+            drop = ("drop_plate", None)
+        elif chef.held is not None:
+            drop = ("drop_item", self._drop_target(near))
+        else:
+            drop = (None, None)
+
+        # ----- ปุ่ม chop (Space) -----
+        chop = ("chop", within(near, "board_item", CHOP_RADIUS))
+
+        self._resolved = Resolution(self.revision, use, drop, chop)
+        return self._resolved
+
+    def _pick_target(self, near):
+        for kind in ("ingredient", "floor_item", "board_item"):
+            found = within(near, kind, PICK_RADIUS)
+            if found is not None:
+                return found
+        return None
+
+    def _drop_target(self, near):
+        return within(near, "chopping_board", DROP_RADIUS) or within(near, "pot", DROP_RADIUS)
+
+    def take_changes(self):
+        """(entity ที่ถูกลบ, entity ที่เพิ่ม/เปลี่ยน) นับจากครั้งก่อน"""
+        removed, dirty = self._removed, list(self._dirty)
+        self._removed = []
+        self._dirty = {}
+        return removed, dirty
+
+    # ------------------- เวลา -------------------
+    def step(self, move_x=0, move_y=0, dt=TICK_SECONDS):
+        """เดินเชฟตามทิศ (-1/0/1) และเดินงานที่ใช้เวลา คืน list ของ event"""
+        events = []
+        chef = self.chef
+        if (move_x or move_y) and chef is not None:
+            dist = chef.speed * dt
+            new_x = max(0, min(chef.x + move_x * dist, self.width - chef.w))
+            new_y = max(0, min(chef.y + move_y * dist, self.height - chef.h))
+            if new_x != chef.x or new_y != chef.y:
+                # ของ/จานในมือติดกับเชฟ (parent) จึงไม่ต้องขยับตาม
+                chef.x, chef.y = new_x, new_y
+                self.mark_dirty(chef)
+
+        for job in self.jobs.advance(dt):
+            events.append(self._job_handlers[job.kind](job))
+        for order in self.orders.advance(dt):
+            events.append(("order_expired", order))
+        return events
+
+    def next_deadline(self):
+        """วินาทีจนถึงงานที่ใช้เวลาชิ้นถัดไปจะเสร็จหรือออร์เดอร์ถัดไปจะหมดอายุ (None ถ้าไม่มี)"""
+        deadlines = [d for d in (self.jobs.next_due(), self.orders.next_due()) if d is not None]
+        return min(deadlines) if deadlines else None
+
+    def job_progress(self, entity):
+        """ความคืบหน้า 0.0–1.0 ของงานที่ทำกับ entity อยู่ (None ถ้าไม่มี) สำหรับ progress bar"""
+        return self.jobs.progress(entity)
+
+    def tick_clock(self, seconds=1):
+        """ลดเวลาที่เหลือ คืน True ถ้าหมดเวลา"""
+        self.remaining_time = max(0, self.remaining_time - seconds)
+        return self.remaining_time <= 0
+
+    # ------------------- ของ (id จาก RecipeBook) -------------------
+    def _new_item(self, kind, item_id, x, y, station=None):
+        book = self.recipes
+        return Item(kind, item_id, book.names[item_id], book.icons[item_id], x, y, station=station)
+
+    def _set_item_id(self, item, item_id):
+        """เปลี่ยนสถานะของ (เช่นหั่นเสร็จ) — ชื่อและ sprite มาจากตารางที่ compile ไว้"""
+        item.id = item_id
+        item.name = self.recipes.names[item_id]
+        item.sprite = self.recipes.icons[item_id]
+        self.mark_dirty(item)
+
+    def item_names(self, ids):
+        return self.recipes.names_of(ids)
+
+    # ------------------- ของในมือ -------------------
+    def _attach_to_chef(self, entity, dx, dy):
+        """ติด entity กับเชฟที่ offset (dx, dy) จากมุมซ้ายบนของเชฟ"""
+        entity.parent = self.chef
+        entity.x, entity.y = dx, dy
+        self.mark_dirty(entity)
+        return entity
+
+    def hold_item(self, item_id):
+        """ให้เชฟถือวัตถุดิบ item_id (ลอยเหนือหัว)"""
+        self._release_held()
+        chef = self.chef
+        chef.held = self._new_item("held", item_id, 0, 0)
+        return self._attach_to_chef(chef.held, (chef.w - chef.held.w) // 2, -chef.held.h - 5)
+
+    def _release_held(self):
+        held = self.chef.held
+        if held is not None:
+            self.mark_removed(held)
+            self.chef.held = None
+        return held
+
+    # ------------------- การหยิบของ -------------------
+    def pick_item(self, threshold=PICK_RADIUS, target=None):
+        """หยิบวัตถุดิบ: ต้นทาง -> บนพื้น -> บนเขียง คืน (ที่มา, ชื่อ) หรือ (None, None)
+
+        target คือของที่ resolve() เลือกไว้แล้ว (ถ้ายังใช้ได้ก็ไม่ต้องหาใหม่)
+        """
+        chef = self.chef
+        if chef.held is not None:
+            return None, None
+        kinds = ("ingredient", "floor_item", "board_item")
+        if self._still_near(target, kinds, threshold):
+            candidates = (target,)
+        else:
+            found = self.near(chef, threshold, kinds)
+            # ลำดับความสำคัญ: ต้นทาง -> บนพื้น -> บนเขียง (ในแต่ละชนิดเอาชิ้นที่ใกล้สุด)
+            candidates = [next((e for _, e in found if e.kind == kind), None) for kind in kinds]
+        for item in candidates:
+            if item is None:
+                continue
+            kind = item.kind
+            if kind == "ingredient":
+                self.hold_item(item.id)
+                return "ingredient", item.name
+            if kind == "floor_item":
+                del self.floor_items[item]
+                source = "floor"
+            else:
+                item.station.contents.remove(item)
+                # หยิบออกจากเขียงระหว่างหั่น = เลิกหั่น
+                self.jobs.cancel(item)
+                source = "board"
+            self._unplace(item)
+            self.hold_item(item.id)
+            return source, item.name
+
+        return None, None
+
+    # ------------------- วางของ -------------------
+    def drop_item(self, target=None):
+        """วางของในมือลงเขียง หม้อ หรือพื้น (หรือทิ้งถ้าอยู่ใกล้ถังขยะ)
+
+        target คือเขียง/หม้อที่ resolve() เลือกไว้ (None = หาเอง)
+        คืน (ปลายทาง, ชื่อ, เริ่มต้มไหม) ปลายทางเป็น "trash", "board", "pot",
+        "floor", "missing" (ไม่มีภาพของ) หรือ None (ไม่มีของในมือ)
+        """
+        chef = self.chef
+        if chef.held is None:
+            return None, None, False
+        item_id, name = chef.held.id, chef.held.name
+
+        if self.near_trash():
+            self._release_held()
+            return "trash", name, False
+
+        if not self.recipes.has_icon[item_id]:
+            return "missing", name, False
+
+        drop_x = chef.x + (chef.w - ICON_SIZE) // 2
+        drop_y = chef.y + chef.h - 10
+        self._release_held()
+
+        if self._still_near(target, ("chopping_board", "pot"), DROP_RADIUS):
+            board = target if target.kind == "chopping_board" else None
+            pot = target if target.kind == "pot" else None
+        else:
+            board = self.nearest(chef, DROP_RADIUS, ("chopping_board",))
+            pot = None if board is not None else self.nearest(chef, DROP_RADIUS, ("pot",))
+
+        if board is not None:
+            item = self._new_item("board_item", item_id, drop_x, drop_y, station=board)
+            board.contents.append(item)
+            self._place(item)
+            return "board", name, False
+
+        if pot is not None:
+            item = self._new_item("pot_item", item_id, drop_x, drop_y, station=pot)
+            self._place(item)
+            batch = pot.add(item)
+            if batch is not None:
+                self.jobs.schedule("boil", pot, batch, BOIL_STAGES[0][1])
+                return "pot", name, True
+            return "pot", name, False
+
+        item = self._new_item("floor_item", item_id, drop_x, drop_y)
+        self.floor_items[item] = None
+        self._place(item)
+        return "floor", name, False
+
+    def _advance_boil(self, job):
+        """จบขั้นหนึ่งของการต้ม: ไปขั้นถัดไป หรือถ้าเป็นขั้นสุดท้าย เอาของชุดนั้นออกจากหม้อ"""
+        batch = job.target
+        batch.stage += 1
+        if batch.stage < len(BOIL_STAGES):
+            stage, seconds = BOIL_STAGES[batch.stage]
+            self.jobs.schedule("boil", batch.pot, batch, seconds)
+            return (stage, batch.items[0])
+        for item in batch.pot.take(batch):
+            self._unplace(item)
+        # ของที่ต้มเสร็จออกจากหม้อไปแล้ว — event บอกชื่อของหลังต้ม (ถ้ามีใน recipe)
+        item = batch.items[0]
+        boiled = self.recipes.next["boil"][item.id]
+        if boiled != wdrecipes.NO_ITEM:
+            item.id, item.name = boiled, self.recipes.names[boiled]
+        return ("boiled", item)
+
+    # ------------------- หั่น -------------------
+    def start_chop(self, radius=CHOP_RADIUS, target=None):
+        """เริ่มหั่นของบนเขียงที่ใกล้เชฟที่สุดที่ยังไม่ได้กำลังหั่นอยู่
+
+        หั่นได้พร้อมกันหลายชิ้น (หลายเขียง หรือหลายชิ้นบนเขียงเดียว) ของที่ยังไม่หั่น
+        มาก่อนของที่หั่นต่อไม่ได้ คืน (สถานะ, item, ระยะ) สถานะ: "busy" (ทุกชิ้นในระยะกำลังหั่น),
+        "empty", "far", "started"
+
+        target คือชิ้นที่ resolve() เลือกไว้ — ถ้ายังหั่นได้และยังไม่มีงานอยู่ก็เริ่มเลย
+        """
+        if (self._still_near(target, ("board_item",), radius) and target not in self.jobs
+                and self.recipes.next["chop"][target.id] != wdrecipes.NO_ITEM):
+            self.jobs.schedule("chop", target.station, target, CHOP_SECONDS)
+            return "started", target, distance_sq(self.chef, target) ** 0.5
+
+        found = self.near(self.chef, radius, ("board_item",))
+        if found:
+            chop = self.recipes.next["chop"]
+            free = [(chop[item.id] == wdrecipes.NO_ITEM, d2, item)
+                    for d2, item in found if item not in self.jobs]
+            if not free:
+                return "busy", found[0][1], None
+            _, nearest_d2, nearest = min(free, key=lambda f: (f[0], f[1]))
+        else:
+            # ไม่มีอะไรในระยะ — หาชิ้นที่ใกล้สุดทั้งครัวไว้บอกระยะ (หรือบอกว่าเขียงว่าง)
+            x, y = self.chef.center()
+            found = self.index.nearest(x, y, kinds=("board_item",))
+            if not found:
+                return "empty", None, None
+            nearest_d2, nearest = found[0]
+            return "far", nearest, nearest_d2 ** 0.5
+
+        dist = nearest_d2 ** 0.5
+
+        self.jobs.schedule("chop", nearest.station, nearest, CHOP_SECONDS)
+        return "started", nearest, dist
+
+    def _finish_chop(self, job):
+        item = job.target
+        # ของอาจถูกหยิบออกจากเขียงไปแล้วระหว่างหั่น
+        if item.station is None or item not in item.station.contents:
+            return ("chop_cancelled", item)
+        chopped = self.recipes.next["chop"][item.id]
+        if chopped == wdrecipes.NO_ITEM:
+            return ("already_chopped", item)
+        if not self.recipes.has_icon[chopped]:
+            return ("chop_cancelled", item)
+        self._set_item_id(item, chopped)
+        return ("chopped", item)
+
+    # ------------------- ถังขยะ -------------------
+    def near_trash(self, threshold=INTERACT_RADIUS):
+        return self.station_near("trash_bin", threshold) is not None
+
+    def throw_item_to_trash(self, threshold=INTERACT_RADIUS, trash=None):
+        """ทิ้งของในมือ หรือถ้ามือว่างให้กวาดของบนพื้นรอบถังทิ้ง
+
+        trash คือถังที่ resolve() เลือกไว้ (None = หาเอง)
+        คืน ("far", ระยะ), ("held", ชื่อ), ("swept", [ชื่อ...]) หรือ ("missing", None)
+        """
+        if not self.stations.get("trash_bin"):
+            return "missing", None
+        if not self._still_near(trash, ("trash_bin",), threshold):
+            trash = self.station_near("trash_bin", threshold)
+        if trash is None:
+            x, y = self.chef.center()
+            d2, _ = self.index.nearest(x, y, kinds=("trash_bin",))[0]
+            return "far", d2 ** 0.5
+
+        if self.chef.held is not None:
+            held = self._release_held()
+            return "held", held.name
+
+        swept = []
+        for _, item in self.near(trash, threshold, ("floor_item",)):
+            del self.floor_items[item]
+            self._unplace(item)
+            swept.append(item.name)
+        return "swept", swept
+
+    # ------------------- จาน -------------------
+    def plate_sprite(self, key):
+        """ภาพจานสำเร็จ plate_<ของเรียงตามชื่อ> ถ้ามี ไม่งั้นภาพประกอบจาก layer (key เป็น RecipeKey)"""
+        return self.recipes.plate_sprite(key)
+
+    def _new_plate(self):
+        """จานเปล่าใบใหม่บน plate_station"""
+        return Plate("station_plate", 0, 0, DROPPED_PLATE_SIZE, DROPPED_PLATE_SIZE, self.recipes.empty)
+
+    def add_item_to_station_plate(self, station=None):
+        """ใส่ของในมือลงจานที่ plate_station (station จาก resolve() ถ้ามี)"""
+        if not self._still_near(station, ("plate_station",), INTERACT_RADIUS):
+            station = self.station_near("plate_station")
+        held = self.chef.held
+        if held is None or station is None:
+            return None
+        self._release_held()
+        items = station.plate.add(held.id, self.recipes)
+        station.sprite = station.plate.sprite
+        self.mark_dirty(station)
+        return items
+
+    def add_item_to_held_plate(self):
+        plate = self.chef.plate
+        held = self.chef.held
+        if plate is None or held is None:
+            return None
+        self._release_held()
+        plate.add(held.id, self.recipes)
+        self.mark_dirty(plate)
+        return plate.items
+
+    def add_item_to_dropped_plate(self, plate):
+        held = self.chef.held
+        if held is None:
+            return None
+        self._release_held()
+        plate.add(held.id, self.recipes)
+        self.mark_dirty(plate)
+        return plate.items
+
+    def dropped_plate_near(self, entity, threshold=INTERACT_RADIUS):
+        """จานบนพื้นที่อยู่ใกล้ entity ที่สุด (None ถ้าไม่มี)"""
+        return self.nearest(entity, threshold, ("plate",))
+
+    def pickup_plate(self, threshold=INTERACT_RADIUS, target=None):
+        """หยิบจานจาก plate_station หรือจากพื้น (พร้อมของบนจาน)
+
+        target คือ plate_station หรือจานบนพื้นที่ resolve() เลือกไว้ (None = หาเอง)
+        คืน "station", "floor", "has_plate" หรือ None
+        """
+        chef = self.chef
+        if chef.held is not None:
+            return None
+
+        if self._still_near(target, ("plate_station",), threshold, mode="bounds"):
+            station, plate = target, None
+        elif self._still_near(target, ("plate",), threshold):
+            station, plate = None, target
+        else:
+            station = self.station_near("plate_station", threshold, mode="bounds")
+            plate = None if station is not None else self.dropped_plate_near(chef, threshold)
+
+        if station is not None:
+            if chef.plate is not None:
+                return "has_plate"
+            # จานใบบนสุดขึ้นมือเชฟ — station มีจานเปล่าใบใหม่
+            self._hold_plate(station.plate)
+            station.plate = self._new_plate()
+            station.sprite = station.plate.sprite
+            self.mark_dirty(station)
+            return "station"
+
+        if plate is not None:
+            del self.dropped_plates[plate]
+            self._unplace(plate)
+            self._hold_plate(plate)
+            return "floor"
+        return None
+
+    def _hold_plate(self, plate):
+        chef = self.chef
+        plate.kind = "held_plate"
+        plate.w = plate.h = HELD_PLATE_SIZE
+        chef.plate = plate
+        # +10 ให้จานลอยเหนือหัวนิดหน่อย
+        self._attach_to_chef(plate, (chef.w - plate.w) // 2, -plate.h + 10)
+
+    def drop_plate(self):
+        chef = self.chef
+        plate = chef.plate
+        if plate is None:
+            return None
+        # sprite เดิมติดอยู่กับเชฟ — ให้ view สร้างใหม่บนพื้น
+        self.mark_removed(plate)
+        chef.plate = None
+        plate.parent = None
+        plate.kind = "plate"
+        plate.x, plate.y = chef.x + 40, chef.y + 40
+        plate.w = plate.h = DROPPED_PLATE_SIZE
+        self.dropped_plates[plate] = None
+        self._place(plate)
+        return plate
+
+    def throw_plate_to_trash(self, trash=None):
+        if self.chef.plate is None:
+            return False
+        if not self._still_near(trash, ("trash_bin",), INTERACT_RADIUS) and not self.near_trash():
+            return False
+        self.mark_removed(self.chef.plate)
+        self.chef.plate = None
+        return True
+
+    # ------------------- เสิร์ฟ -------------------
+    def order_names(self):
+        """ชื่อของออร์เดอร์ที่รออยู่ สำหรับแสดงบน HUD"""
+        return [self.recipes.combo_name(order.key) for order in self.orders]
+
+    def order_status(self):
+        """[(ชื่อ, วินาทีที่เหลือ)] ของออร์เดอร์ที่รออยู่ ตามลำดับที่สั่ง"""
+        now = self.orders.now
+        return [(self.recipes.combo_name(order.key), order.remaining(now)) for order in self.orders]
+
+    def _score_plate(self, plate):
+        """ให้คะแนนจานที่เสิร์ฟ: ตรงกับออร์เดอร์ไหนก็ได้ที่เปิดอยู่ ได้ ORDER_POINTS
+        บวกทิปตามเวลาที่เหลือของใบนั้น คืนคะแนนที่ได้ (0 ถ้าไม่ตรงใบไหนเลย)
+        """
+        order, tip = self.orders.serve(plate.key)
+        if order is None:
+            return 0
+        points = ORDER_POINTS + tip
+        self.score += points
+        return points
+
+    def serve_plate(self, threshold=INTERACT_RADIUS, serve=None):
+        """เสิร์ฟจานในมือ หรือจานบนพื้นที่อยู่ใกล้จุดเสิร์ฟ
+
+        serve คือจุดเสิร์ฟที่ resolve() เลือกไว้ (None = หาเอง)
+        คืน (ที่มา, ของบนจาน, คะแนนที่ได้) ที่มาเป็น "held", "floor",
+        "far" (เชฟไม่ได้อยู่ใกล้จุดเสิร์ฟ) หรือ None (ไม่มีจาน)
+        """
+        if not self.stations.get("serve_station"):
+            return None, [], 0
+        if not self._still_near(serve, ("serve_station",), threshold):
+            serve = self.station_near("serve_station", threshold)
+        if serve is None:
+            return "far", [], 0
+
+        plate = self.chef.plate
+        if plate is not None:
+            self.mark_removed(plate)
+            self.chef.plate = None
+            return "held", plate.items, self._score_plate(plate)
+
+        plate = self.dropped_plate_near(serve, threshold)
+        if plate is not None:
+            del self.dropped_plates[plate]
+            self._unplace(plate)
+            return "floor", plate.items, self._score_plate(plate)
+        return None, [], 0
@@ -0,0 +1,193 @@
+"""Recipe graph for Well Done! — ไม่มี Qt ในไฟล์นี้
+
+วัตถุดิบและการแปลงสภาพ (หั่น ต้ม) ประกาศไว้ที่เดียวใน INGREDIENTS/TRANSITIONS แล้ว
+compile ตอนโหลดเกมเป็น RecipeBook: ของแต่ละสถานะได้ id จำนวนเต็ม ตารางแปลงสภาพเป็น
+list ที่ index ด้วย id และชื่อ sprite คำนวณไว้ล่วงหน้า — ระหว่างเล่นไม่ต้องต่อ/ตัด string อีก
+"""
+import random
+from bisect import bisect_right
+
+INGREDIENTS = ("tomato", "lettuce", "cucamber")
+
+# (action, ต้นทาง, ปลายทาง) — {raw} คือชื่อวัตถุดิบดิบ
+TRANSITIONS = (
+    ("chop", "{raw}", "{raw}_chopped"),
+    ("boil", "{raw}", "{raw}_boiled"),
+    ("boil", "{raw}_chopped", "{raw}_boiled"),
+)
+
+NO_ITEM = -1  # ในตารางแปลงสภาพ: ทำ action นี้กับของนี้ไม่ได้
+# ชื่อภาพจานที่ประกอบตอนรัน: "plate+tomato_chopped+lettuce_chopped"
+# (wellDoneGameAssets วาด layer ของแต่ละชิ้นทับภาพจานเปล่า)
+PLATE_LAYER_SEP = "+"
+_HASH_MASK = (1 << 64) - 1
+
+
+class RecipeKey:
+    """ชุดของแบบ canonical (multiset ของ id): ids เรียงแล้ว และ hash ที่เป็นผลบวกของค่าสุ่ม
+    ประจำ id แต่ละชิ้น — เพิ่มของหนึ่งชิ้นได้ key ใหม่โดยไม่ต้อง sort หรือ hash ใหม่ทั้งชุด
+    (RecipeBook.extend) และเทียบ/ใช้เป็น key ของ dict ได้ด้วย hash ที่เก็บไว้แล้ว
+    """
+    __slots__ = ("ids", "_hash")
+
+    def __init__(self, ids, key_hash):
+        self.ids = ids
+        self._hash = key_hash
+
+    def __hash__(self):
+        return self._hash
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if not isinstance(other, RecipeKey):
+            return NotImplemented
+        return self._hash == other._hash and self.ids == other.ids
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __iter__(self):
+        return iter(self.ids)
+
+    def __repr__(self):
+        return f"RecipeKey{self.ids}"
+
+
+class RecipeBook:
+    """recipe graph ที่ compile แล้ว
+
+    names[id]    ชื่อของ (เช่น "tomato_chopped")
+    raw[id]      id ของวัตถุดิบดิบต้นทาง
+    icons[id]    ชื่อ sprite ของ icon, has_icon[id] มีภาพนั้นไหม
+    actions[id]  frozenset ของ action ที่ทำกับของนี้ได้
+    next[action][id]  id หลังทำ action (NO_ITEM ถ้าทำไม่ได้)
+
+    ชุดของ (บนจาน/ออร์เดอร์) ใช้ RecipeKey — empty คือชุดว่าง
+    """
+
+    def __init__(self, transitions=TRANSITIONS, has_sprite=None):
+        self.transitions = tuple(transitions)
+        self.has_sprite = has_sprite or (lambda name: True)
+        self.names = []
+        self.ids = {}
+        self.raw = []
+        self.icons = []
+        self.has_icon = []
+        self.actions = []
+        self.zobrist = []  # id -> ค่าสุ่ม 64 bit สำหรับ hash ของ RecipeKey
+        self.next = {action: [] for action, _, _ in self.transitions}
+        self.empty = RecipeKey((), 0)
+        self._combo_names = {}   # key -> "a_b" (ชื่อเรียงตามตัวอักษร แบบชื่อไฟล์จาน)
+        self._plate_sprites = {}  # key -> ชื่อ sprite ของจาน
+
+    def __len__(self):
+        return len(self.names)
+
+    def add_ingredient(self, raw):
+        """เพิ่มวัตถุดิบดิบพร้อมทุกสถานะที่แปลงไปได้ คืน id ของวัตถุดิบดิบ"""
+        raw_id = self.ids.get(raw)
+        if raw_id is not None:
+            return raw_id
+        raw_id = self._intern(raw, None)
+        for action, src, dst in self.transitions:
+            a = self._intern(src.format(raw=raw), raw_id)
+            b = self._intern(dst.format(raw=raw), raw_id)
+            self.next[action][a] = b
+            self.actions[a] = self.actions[a] | {action}
+        return raw_id
+
+    def _intern(self, name, raw_id):
+        item_id = self.ids.get(name)
+        if item_id is not None:
+            return item_id
+        item_id = len(self.names)
+        self.ids[name] = item_id
+        self.names.append(name)
+        self.raw.append(item_id if raw_id is None else raw_id)
+        icon = f"{name}_icon"
+        self.icons.append(icon)
+        self.has_icon.append(bool(self.has_sprite(icon)))
+        self.actions.append(frozenset())
+        self.zobrist.append(random.Random(name).getrandbits(64))
+        for table in self.next.values():
+            table.append(NO_ITEM)
+        return item_id
+
+    def apply(self, action, item_id):
+        """id หลังทำ action กับ item_id (NO_ITEM ถ้าทำไม่ได้)"""
+        return self.next[action][item_id]
+
+    def can(self, item_id, action):
+        return action in self.actions[item_id]
+
+    def raw_name(self, item_id):
+        return self.names[self.raw[item_id]]
+
+    def names_of(self, ids):
+        names = self.names
+        return [names[i] for i in ids]
+
+    def key(self, ids):
+        """RecipeKey ของชุด ids (ลำดับไม่สำคัญ)"""
+        ids = tuple(sorted(ids))
+        zobrist = self.zobrist
+        return RecipeKey(ids, sum(zobrist[i] for i in ids) & _HASH_MASK)
+
+    def extend(self, key, item_id):
+        """key ของชุดเดิมบวกของอีกหนึ่งชิ้น — แทรก id ในตำแหน่งที่เรียงไว้ และบวก hash เพิ่ม"""
+        ids = key.ids
+        i = bisect_right(ids, item_id)
+        return RecipeKey(ids[:i] + (item_id,) + ids[i:], (key._hash + self.zobrist[item_id]) & _HASH_MASK)
+
+    def parse_combo(self, text):
+        """"lettuce_chopped_tomato_chopped" -> key (None ถ้ามีชื่อที่ไม่รู้จัก)
+
+        ใช้ตอนโหลดเท่านั้น (ชื่อไฟล์จาน/ออร์เดอร์) — จับชื่อที่ยาวที่สุดก่อน
+        """
+        parts = text.split("_")
+        ids = []
+        i = 0
+        while i < len(parts):
+            for j in range(len(parts), i, -1):
+                item_id = self.ids.get("_".join(parts[i:j]))
+                if item_id is not None:
+                    ids.append(item_id)
+                    i = j
+                    break
+            else:
+                return None
+        return self.key(ids)
+
+    def combo_name(self, key):
+        """ชื่อของชุด แบบที่ใช้ในชื่อไฟล์จาน (คำนวณครั้งเดียวต่อชุด)"""
+        name = self._combo_names.get(key)
+        if name is None:
+            name = self._combo_names[key] = "_".join(sorted(self.names_of(key)))
+        return name
+
+    def plate_sprite(self, key):
+        """ชื่อภาพของจานที่มีชุด key (RecipeKey) — คำนวณครั้งเดียวต่อชุด
+
+        ใช้ภาพสำเร็จ plate_<ชุด> ถ้ามีไฟล์ ไม่งั้นเป็นชื่อภาพประกอบ plate+<ของ>+<ของ>
+        ตามลำดับของ key (จานว่าง = "plate")
+        """
+        sprite = self._plate_sprites.get(key)
+        if sprite is None:
+            combo = f"plate_{self.combo_name(key)}"
+            if not key.ids:
+                sprite = "plate"
+            elif self.has_sprite(combo):
+                sprite = combo
+            else:
+                sprite = PLATE_LAYER_SEP.join(["plate", *self.names_of(key)])
+            self._plate_sprites[key] = sprite
+        return sprite
+
+
+def compile_recipes(ingredients=INGREDIENTS, transitions=TRANSITIONS, has_sprite=None):
+    """compile recipe graph ครั้งเดียวตอนโหลดเกม"""
+    book = RecipeBook(transitions, has_sprite)
+    for raw in ingredients:
+        book.add_ingredient(raw)
+    return book
@@ -0,0 +1,414 @@
+"""Single-canvas sprite renderer for Well Done!
+
+แทน QLabel หนึ่งตัวต่อหนึ่งวัตถุ: sprite เป็น object ธรรมดา (ไม่ใช่ widget) เรียงตาม z
+แล้ววาดทั้งหมดใน paintEvent เดียวของ SpriteCanvas — ไม่มี stylesheet polish ต่อชิ้น
+และจำนวน widget ไม่เพิ่มตามของที่วางในครัว
+
+พิกัดของ sprite เป็นพิกัดโลก (world) ส่วน canvas มีกล้อง (camera) เป็นมุมซ้ายบนของ
+viewport — paintEvent ถาม SpriteGrid เฉพาะ sprite ที่ทับพื้นที่ที่ต้องวาด ครัวใหญ่
+แค่ไหนก็วาดเท่ากับจำนวน sprite ที่อยู่ในจอ
+
+sprite ติดกับ sprite อื่นได้ (SpriteCanvas.attach) — ลูกเก็บตำแหน่งเป็น offset จากแม่
+ขยับแม่ครั้งเดียวลูกก็ไปด้วย (เช่นของ/จานในมือเชฟ) ใน grid มีเฉพาะ sprite ราก
+โดยใช้กล่องที่ครอบทั้งต้น
+"""
+from PySide6 import QtCore, QtGui, QtWidgets
+
+try:
+    from . import wellDoneGameAssets as wdassets
+except Exception:
+    import wellDoneGameAssets as wdassets
+
+# ลำดับชั้นการวาดตาม entity.kind (ค่ามากวาดทับค่าน้อย) — kind อื่น ๆ คือ station
+LAYERS = {
+    "decor": 0,
+    "ingredient": 2,
+    "floor_item": 3,
+    "board_item": 3,
+    "pot_item": 3,
+    "plate": 3,
+    "chef": 4,
+    "held": 5,
+    "held_plate": 5,
+}
+STATION_LAYER = 1
+
+GRID_CELL = 256  # ขนาดช่องของ SpriteGrid (px ในพิกัดโลก)
+
+HIGHLIGHT_COLOR = "#FFEB3B"
+HIGHLIGHT_PAD = 4
+
+
+def layer_of(kind):
+    return LAYERS.get(kind, STATION_LAYER)
+
+
+class Sprite:
+    """ภาพหนึ่งชิ้นบน canvas: ชื่อ sprite + กล่องที่วาด + z
+
+    ย้าย/เปลี่ยนภาพผ่าน SpriteCanvas.set_geometry()/set_sprite() เพื่อให้ canvas
+    repaint เฉพาะบริเวณที่เปลี่ยน
+    """
+    __slots__ = ("kind", "name", "x", "y", "w", "h", "z", "seq", "visible",
+                 "parent", "children", "_pix", "_pix_key")
+
+    def __init__(self, name, x=0, y=0, w=0, h=0, z=0, kind=None):
+        self.kind = kind      # กลุ่มของ sprite ใน SpritePool (เช่น entity.kind)
+        self.name = name
+        self.x = x            # พิกัดโลก หรือ offset จาก parent ถ้าติดอยู่กับ sprite อื่น
+        self.y = y
+        self.w = w
+        self.h = h
+        self.z = z
+        self.seq = 0          # ลำดับที่ถูกเพิ่ม ใช้ตัดสินเมื่อ z เท่ากัน
+        self.visible = True
+        self.parent = None
+        self.children = []
+        self._pix = None
+        self._pix_key = None
+
+    def world_pos(self):
+        x, y = self.x, self.y
+        parent = self.parent
+        while parent is not None:
+            x += parent.x
+            y += parent.y
+            parent = parent.parent
+        return x, y
+
+    def root(self):
+        sprite = self
+        while sprite.parent is not None:
+            sprite = sprite.parent
+        return sprite
+
+    def rect(self):
+        """กล่องของ sprite นี้ในพิกัดโลก"""
+        x, y = self.world_pos()
+        return QtCore.QRect(int(x), int(y), int(self.w), int(self.h))
+
+    def tree_rect(self):
+        """กล่องที่ครอบ sprite นี้และลูกทั้งหมด"""
+        rect = self.rect()
+        for child in self.children:
+            rect = rect.united(child.tree_rect())
+        return rect
+
+    def pixmap(self, dpr=1.0):
+        """pixmap ที่ย่อไว้แล้วตามขนาดที่วาด (ถามจาก pixmap_cache เมื่อภาพ/ขนาดเปลี่ยนเท่านั้น)"""
+        key = (self.name, self.w, self.h, dpr)
+        if key != self._pix_key:
+            self._pix = wdassets.pixmap_cache.scaled(self.name, self.w, self.h, dpr)
+            self._pix_key = key
+        return self._pix
+
+    def __repr__(self):
+        return f"<Sprite {self.name} z={self.z} @({self.x:.0f},{self.y:.0f})>"
+
+
+class SpriteGrid:
+    """Uniform grid ของ sprite ตามช่องที่กล่องของมันทับ ใช้ cull sprite นอกจอ
+
+    sprite ใหญ่ (เช่นโต๊ะ) อยู่ได้หลายช่อง query() คืน set ของ sprite ที่อาจทับกล่องที่ถาม
+    """
+    __slots__ = ("cell", "cells", "where")
+
+    def __init__(self, cell=GRID_CELL):
+        self.cell = cell
+        self.cells = {}   # (cx, cy) -> set ของ sprite
+        self.where = {}   # sprite -> (x0, y0, x1, y1) ช่วงช่องที่อยู่
+
+    def __len__(self):
+        return len(self.where)
+
+    def _span(self, x, y, w, h):
+        c = self.cell
+        return (int(x // c), int(y // c), int((x + max(w, 1) - 1) // c), int((y + max(h, 1) - 1) // c))
+
+    def insert(self, sprite, box=None):
+        """เพิ่ม sprite หรืออัปเดตช่องถ้าย้ายที่/เปลี่ยนขนาด
+
+        box: (x, y, w, h) ที่ใช้แทนกล่องของ sprite เอง (เช่นกล่องที่ครอบลูกด้วย)
+        """
+        span = self._span(*(box or (sprite.x, sprite.y, sprite.w, sprite.h)))
+        old = self.where.get(sprite)
+        if old == span:
+            return
+        if old is not None:
+            self._discard(sprite, old)
+        x0, y0, x1, y1 = span
+        cells = self.cells
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    cells[(cx, cy)] = bucket = set()
+                bucket.add(sprite)
+        self.where[sprite] = span
+
+    move = insert
+
+    def remove(self, sprite):
+        span = self.where.pop(sprite, None)
+        if span is not None:
+            self._discard(sprite, span)
+
+    def _discard(self, sprite, span):
+        x0, y0, x1, y1 = span
+        cells = self.cells
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is not None:
+                    bucket.discard(sprite)
+                    if not bucket:
+                        del cells[(cx, cy)]
+
+    def clear(self):
+        self.cells.clear()
+        self.where.clear()
+
+    def query(self, x, y, w, h):
+        x0, y0, x1, y1 = self._span(x, y, w, h)
+        cells = self.cells
+        found = set()
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    found |= bucket
+        return found
+
+
+class SpritePool:
+    """เก็บ sprite ที่เลิกใช้แยกตาม kind ไว้ใช้ซ้ำ แทนการสร้างใหม่ทุกครั้งที่หยิบ/วางของ
+
+    sprite ที่ได้กลับมามักมีชื่อและขนาดเดิม จึงได้ pixmap ที่ย่อไว้แล้วกลับมาด้วย
+    """
+
+    def __init__(self, canvas):
+        self.canvas = canvas
+        self.free = {}     # kind -> [Sprite]
+        self.live = 0
+        self.peak = 0
+        self.created = 0
+        self.reused = 0
+
+    def acquire(self, kind, name, x, y, w, h, z=0):
+        """sprite ที่พร้อมวาดบน canvas (ใช้ตัวเก่าของ kind เดียวกันถ้ามี)"""
+        free = self.free.get(kind)
+        if free:
+            sprite = free.pop()
+            sprite.name = name
+            sprite.x, sprite.y, sprite.w, sprite.h = x, y, w, h
+            sprite.z = z
+            sprite.visible = True
+            sprite.parent = None
+            sprite.children = []
+            self.reused += 1
+        else:
+            sprite = Sprite(name, x, y, w, h, z, kind=kind)
+            self.created += 1
+        self.live += 1
+        self.peak = max(self.peak, self.live)
+        return self.canvas.add_sprite(sprite)
+
+    def release(self, sprite):
+        """เอา sprite ออกจาก canvas แล้วเก็บไว้ใช้ใหม่"""
+        self.canvas.remove_sprite(sprite)
+        self.free.setdefault(sprite.kind, []).append(sprite)
+        self.live -= 1
+
+    def release_all(self, sprites):
+        for sprite in sprites:
+            self.release(sprite)
+
+    def stats(self):
+        return {
+            "live": self.live,
+            "peak": self.peak,
+            "created": self.created,
+            "reused": self.reused,
+            "free": sum(len(free) for free in self.free.values()),
+        }
+
+
+class SpriteCanvas(QtWidgets.QWidget):
+    """widget เดียวที่วาด sprite ทั้งหมดเรียงตาม (z, ลำดับที่เพิ่ม)
+
+    background: สีพื้น (QColor/str) หรือ None = โปร่งใส เห็น widget ด้านหลัง
+    camera_x/camera_y: พิกัดโลกของมุมซ้ายบนจอ (0, 0 = ไม่เลื่อน)
+    """
+
+    def __init__(self, parent=None, background=None):
+        super().__init__(parent)
+        self.background = QtGui.QColor(background) if background is not None else None
+        if self.background is not None:
+            self.setAttribute(QtCore.Qt.WA_OpaquePaintEvent)
+        self.sprites = {}       # ordered set ของ Sprite ทั้งหมด
+        self.grid = SpriteGrid()
+        self.pool = SpritePool(self)
+        self._seq = 0
+        self._highlight = None  # QRect (พิกัดโลก) หรือ None
+        self.camera_x = 0
+        self.camera_y = 0
+        self.paint_count = 0
+        self.painted_sprites = 0  # จำนวน sprite ที่วาดใน paintEvent ล่าสุด
+
+    # ------------------- กล้อง -------------------
+    def set_camera(self, x, y):
+        x, y = int(x), int(y)
+        if (x, y) != (self.camera_x, self.camera_y):
+            self.camera_x, self.camera_y = x, y
+            self.update()
+
+    def viewport_rect(self):
+        """พื้นที่ของโลกที่อยู่ในจอตอนนี้"""
+        return QtCore.QRect(self.camera_x, self.camera_y, self.width(), self.height())
+
+    def _invalidate(self, rect):
+        # rect เป็นพิกัดโลก -> แปลงเป็นพิกัด widget ก่อนสั่ง repaint
+        self.update(rect.translated(-self.camera_x, -self.camera_y))
+
+    def _index(self, sprite):
+        # grid เก็บเฉพาะราก ด้วยกล่องที่ครอบทั้งต้น
+        root = sprite.root()
+        box = root.tree_rect()
+        self.grid.insert(root, (box.x(), box.y(), box.width(), box.height()))
+
+    # ------------------- sprite -------------------
+    def add_sprite(self, sprite):
+        self._seq += 1
+        sprite.seq = self._seq
+        self.sprites[sprite] = None
+        self._index(sprite)
+        self._invalidate(sprite.tree_rect())
+        return sprite
+
+    def create_sprite(self, name, x, y, w, h, z=0):
+        return self.add_sprite(Sprite(name, x, y, w, h, z))
+
+    def remove_sprite(self, sprite):
+        if sprite not in self.sprites:
+            return
+        for child in list(sprite.children):
+            self.detach(child)
+        del self.sprites[sprite]
+        self._invalidate(sprite.rect())
+        parent = sprite.parent
+        if parent is not None:
+            parent.children.remove(sprite)
+            sprite.parent = None
+            self._index(parent)
+        else:
+            self.grid.remove(sprite)
+
+    def attach(self, child, parent, x=0, y=0):
+        """ติด child กับ parent ที่ offset (x, y) — ขยับ parent แล้ว child ไปด้วย"""
+        self._invalidate(child.tree_rect())
+        old = child.parent
+        if old is not None:
+            old.children.remove(child)
+            self._index(old)
+        else:
+            self.grid.remove(child)
+        child.parent = parent
+        child.x, child.y = x, y
+        parent.children.append(child)
+        self._index(parent)
+        self._invalidate(child.tree_rect())
+
+    def detach(self, child):
+        """แยก child ออกจาก parent โดยคงตำแหน่งบนจอไว้"""
+        parent = child.parent
+        if parent is None:
+            return
+        child.x, child.y = child.world_pos()
+        parent.children.remove(child)
+        child.parent = None
+        self._index(parent)
+        self._index(child)
+
+    def clear_sprites(self):
+        self.sprites = {}
+        self.grid.clear()
+        self.update()
+
+    def set_geometry(self, sprite, x, y, w=None, h=None):
+        """ย้าย/ปรับขนาด sprite (x, y เป็น offset จาก parent ถ้าติดอยู่) ลูกย้ายตามไปด้วย"""
+        if (x, y, w or sprite.w, h or sprite.h) == (sprite.x, sprite.y, sprite.w, sprite.h):
+            return
+        old = sprite.tree_rect()
+        sprite.x = x
+        sprite.y = y
+        if w is not None:
+            sprite.w = w
+        if h is not None:
+            sprite.h = h
+        self._index(sprite)
+        self._invalidate(old)
+        self._invalidate(sprite.tree_rect())
+
+    def set_sprite(self, sprite, name):
+        if sprite.name != name:
+            sprite.name = name
+            self._invalidate(sprite.rect())
+
+    def set_z(self, sprite, z):
+        if sprite.z != z:
+            sprite.z = z
+            self._invalidate(sprite.rect())
+
+    def set_visible(self, sprite, visible):
+        if sprite.visible != visible:
+            sprite.visible = visible
+            self._invalidate(sprite.rect())
+
+    def set_highlight(self, rect):
+        """กรอบไฮไลต์รอบ QRect ในพิกัดโลก (None = ซ่อน)"""
+        if rect is not None:
+            rect = rect.adjusted(-HIGHLIGHT_PAD, -HIGHLIGHT_PAD, HIGHLIGHT_PAD, HIGHLIGHT_PAD)
+        if rect == self._highlight:
+            return
+        if self._highlight is not None:
+            self._invalidate(self._highlight.adjusted(-2, -2, 2, 2))
+        self._highlight = rect
+        if rect is not None:
+            self._invalidate(rect.adjusted(-2, -2, 2, 2))
+
+    # ------------------- วาด -------------------
+    def paintEvent(self, event):
+        painter = QtGui.QPainter(self)
+        clip = event.rect()
+        if self.background is not None:
+            painter.fillRect(clip, self.background)
+
+        # cull: เอาเฉพาะต้นที่ทับพื้นที่ที่ต้องวาด (รวมลูก) แล้วค่อยเรียงตาม z
+        cam_x, cam_y = self.camera_x, self.camera_y
+        stack = list(self.grid.query(clip.x() + cam_x, clip.y() + cam_y, clip.width(), clip.height()))
+        visible = []
+        while stack:
+            sprite = stack.pop()
+            visible.append(sprite)
+            if sprite.children:
+                stack.extend(sprite.children)
+        visible.sort(key=lambda s: (s.z, s.seq))
+        painter.translate(-cam_x, -cam_y)
+
+        dpr = self.devicePixelRatioF()
+        for sprite in visible:
+            if not sprite.visible:
+                continue
+            pix = sprite.pixmap(dpr)
+            if not pix.isNull():
+                x, y = sprite.world_pos()
+                painter.drawPixmap(int(x), int(y), pix)
+        self.painted_sprites = len(visible)
+
+        if self._highlight is not None:
+            pen = QtGui.QPen(QtGui.QColor(HIGHLIGHT_COLOR), 3)
+            painter.setPen(pen)
+            painter.setBrush(QtCore.Qt.NoBrush)
+            painter.drawRoundedRect(self._highlight, 8, 8)
+        painter.end()
+        self.paint_count += 1
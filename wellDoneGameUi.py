@@ -1,6 +1,5 @@
-from PySide6 import QtCore, QtGui, QtWidgets
-from shiboken6 import wrapInstance
-import maya.OpenMayaUI as omui
+from PySide6 import QtCore, QtWidgets
+from shiboken6 import wrapInstance, isValid
 import importlib
 import sys, os
 import time
@@ -11,11 +10,45 @@ try:
 except Exception:
     import wellDoneGameUtil as wdutil
 try:
-    importlib.reload(wdutil)
+    from . import wellDoneGameAssets as wdassets
+except Exception:
+    import wellDoneGameAssets as wdassets
+try:
+    from . import wellDoneGameModel as wdmodel
+except Exception:
+    import wellDoneGameModel as wdmodel
+try:
+    from . import wellDoneGameRender as wdrender
+except Exception:
+    import wellDoneGameRender as wdrender
+try:
+    from . import wellDoneGameLoop as wdloop
 except Exception:
-    pass
+    import wellDoneGameLoop as wdloop
+
 
-SOURCE_PATH = os.path.join(os.path.dirname(__file__), "source_image", "image")
+def _game_modules():
+    """โมดูลที่มีคลาสของสถานะเกม เรียงตามลำดับ import — reload ต้องไล่ตามลำดับนี้
+
+    (wellDoneGameAssets ไม่อยู่ในนี้ เพื่อให้ภาพที่ถอดรหัสไว้ยังอยู่ข้ามการ reload)
+    """
+    return (wdmodel.wdrecipes, wdmodel, wdloop, wdrender)
+
+
+def _source_stamp():
+    """(mtime, size) ของไฟล์ UI นี้และโมดูลสถานะเกม ใช้ตัดสินว่าต้องสร้างหน้าต่างใหม่หรือไม่"""
+    stamp = []
+    for path in (__file__, *(module.__file__ for module in _game_modules())):
+        try:
+            st = os.stat(path)
+            stamp.append((st.st_mtime, st.st_size))
+        except OSError:
+            stamp.append(None)
+    return tuple(stamp)
+
+
+# version of this file that the classes below were built from
+SOURCE_STAMP = _source_stamp()
 
 class GameMenu(QtWidgets.QWidget):
     def __init__(self, stacked_widget, parent=None):
@@ -26,8 +59,7 @@ class GameMenu(QtWidgets.QWidget):
         self.layout.setContentsMargins(0, 0, 0, 0)
 
         self.bg = QtWidgets.QLabel(self)
-        self.bg.setPixmap(QtGui.QPixmap(f"{SOURCE_PATH}/background.png"))
-        self.bg.setScaledContents(True)
+        self.bg.setPixmap(wdassets.get_pixmap("background.png"))
         self.bg.lower()
 
         self.menuLayout = QtWidgets.QVBoxLayout()
@@ -105,9 +137,25 @@ class GameMenu(QtWidgets.QWidget):
 
         self.layout.addLayout(self.menuLayout)
 
+        # โหลดภาพล่วงหน้าระหว่างอยู่หน้าเมนู — กด START ได้เมื่อ cache พร้อม
+        self.startButton.setEnabled(False)
+        self.preloader = wdassets.AssetPreloader(self, dpr=self.devicePixelRatioF())
+        self.preloader.progress.connect(self._on_preload_progress)
+        self.preloader.ready.connect(self._on_preload_ready)
+        self.preloader.start()
+
+    def _on_preload_progress(self, done, total):
+        if not self.preloader.is_ready and total:
+            self.startButton.setText(f"LOADING {100 * done // total}%")
+
+    def _on_preload_ready(self):
+        self.startButton.setText('START')
+        self.startButton.setEnabled(True)
+
     def resizeEvent(self, event):
         if self.bg and self.bg.pixmap():
-            self.bg.setGeometry(self.rect()) 
+            self.bg.setGeometry(self.rect())
+            wdassets.set_label_sprite(self.bg, "background")
         super().resizeEvent(event)
 
 
@@ -127,211 +175,193 @@ class HowToPlayPage(QtWidgets.QWidget):
         back.setFixedSize(80, 60)
         back.clicked.connect(lambda: stacked_widget.setCurrentIndex(0))
         img = QtWidgets.QLabel()
-        img.setPixmap(QtGui.QPixmap(f"{SOURCE_PATH}/howtoplay.webp"))
-        img.setScaledContents(True)
         img.setFixedSize(1200, 675)
+        wdassets.set_label_sprite(img, "howtoplay", 1200, 675)
         layout.addWidget(back, alignment=QtCore.Qt.AlignTop | QtCore.Qt.AlignLeft)
         layout.addWidget(img, alignment=QtCore.Qt.AlignCenter)
 
-class GameWidget(QtWidgets.QWidget):
-    def __init__(self):
-        super().__init__()
+# ปุ่มเดิน — ถ้าไม่มีปุ่มไหนกดค้าง game loop หลับได้
+MOVE_KEYS = frozenset((QtCore.Qt.Key_Left, QtCore.Qt.Key_Right, QtCore.Qt.Key_Up, QtCore.Qt.Key_Down))
+
+# ปุ่ม -> ช่องของ wellDoneGameModel.Resolution
+KEY_SLOTS = {
+    QtCore.Qt.Key_F: "use",
+    QtCore.Qt.Key_G: "drop",
+    QtCore.Qt.Key_Space: "chop",
+}
+
+
+class GameWidget(wdrender.SpriteCanvas):
+    """View ของ wellDoneGameModel.Kitchen — วาดทุก entity เป็น sprite บน canvas เดียว
+
+    สถานะเกมทั้งหมดอยู่ที่ self.model; widget แค่ sync ตำแหน่ง/ภาพตามที่ model บอก
+
+    level: ชื่อด่านใน wellDoneGameModel.LEVELS (ค่าเริ่มต้นจาก $WELLDONE_LEVEL หรือ "classic")
+    seed:  seed ของออร์เดอร์ (ค่าเริ่มต้นจาก $WELLDONE_SEED ไม่ตั้ง = สุ่มทุกครั้ง)
+    ด่านห้องเดียวพื้นหลังโปร่งใส ให้เห็น bg_kitchen ของ GamePage ด้านหลัง ส่วนด่านที่ใหญ่กว่า
+    หน้าต่างจะมีสีพื้นของตัวเองและกล้องเลื่อนตามเชฟ
+    """
+    def __init__(self, level=None, seed=None):
+        self.level = level or os.environ.get("WELLDONE_LEVEL", "classic")
+        if seed is None and os.environ.get("WELLDONE_SEED"):
+            seed = int(os.environ["WELLDONE_SEED"])
+        if self.level not in wdmodel.LEVELS:
+            print(f"⚠️ ไม่มีด่าน {self.level} ใช้ classic แทน")
+            self.level = "classic"
+        scrolling = wdmodel.LEVELS[self.level]["rooms"] != (1, 1)
+        super().__init__(background="#8BC34A" if scrolling else None)  # สีพื้นสนาม
         self.setFocusPolicy(QtCore.Qt.StrongFocus)
-        self.setStyleSheet("background-color: #8BC34A;")  # สีพื้นสนาม
-        self.objects = []
 
+        manifest = wdassets.get_manifest()
+        self.model = wdmodel.Kitchen(has_sprite=manifest.has, order_combos=manifest.order_combos(), seed=seed)
+        self.views = {}  # entity -> wdrender.Sprite
+        self._highlight_target = None
+        self.world_size = None  # (w, h) ถ้าด่านใหญ่กว่าหน้าต่าง
 
         # สร้างวัตถุในฉาก
         self.create_game_objects()
-
-        # ตัวละคร (เชฟ)
-        self.has_item = False
-        self.current_item = None
-        self.held_icon = None
-
-        self.placed_items = []
-
-        self.pot_icons = []  # เก็บ QLabel ของวัตถุดิบบน pot
-        self.pot_contents = [] # ข้อมูลวัตถุดิบ
-
-        self.chef = QtWidgets.QLabel(self)
-        chef_pixmap = QtGui.QPixmap(f"{SOURCE_PATH}/chef.png")
-
-        # ให้รองรับ transparency และไม่ขึ้นสีพื้น
-        self.chef.setAttribute(QtCore.Qt.WA_TranslucentBackground)
-        self.chef.setStyleSheet("background: transparent;")
-
-        self.chef.setPixmap(chef_pixmap)
-        self.chef.setScaledContents(True)
-        self.chef.resize(111.875, 133.33)
-        self.chef.move(200, 400)
-        self.chef_speed = 8
-
-
-        # ตัวจับเวลาเดินอัตโนมัติ
-        self.timer = QtCore.QTimer(self)
-        self.timer.timeout.connect(self.update_position)
-        self.timer.start(16)
+        self.model.reset(remaining_time=50)
+        self.sync_view()
+
+        # game loop: เดินเกมทีละ TICK_SECONDS ตามเวลาจริง แล้ววาดหลังเดินเสร็จ
+        # ไม่มีปุ่มเดินกดค้าง = หลับจนถึงวินาทีถัดไปหรืองานหั่นเสร็จ
+        self.loop = wdloop.GameLoop(
+            self.simulate, self.render_frame, parent=self,
+            is_idle=self.is_idle,
+            next_deadline=lambda: self.model.next_deadline(),
+            is_throttled=self.is_throttled,
+        )
+        # GamePage.begin_play() จะเริ่ม loop เมื่อเริ่มเล่นจริง
         self.pressed_keys = set()
 
-    def create_image_object(self, x, y, w, h, image_name):
-        """สร้าง QLabel ที่มีภาพ"""
-        obj = QtWidgets.QLabel(self)
-        obj.setGeometry(x, y, w, h)
-        obj.setStyleSheet("background: transparent;")
-        pix = QtGui.QPixmap(f"{SOURCE_PATH}/{image_name}")
-        obj.setPixmap(pix)
-        obj.setScaledContents(True)
-        self.objects.append(obj)
-        return obj
+    def create_image_object(self, entity):
+        """sprite สำหรับแสดง entity (ใช้ตัวเก่าจาก pool ถ้ามี)"""
+        sprite = self.pool.acquire(entity.kind, entity.sprite, entity.x, entity.y, entity.w, entity.h,
+                                   z=wdrender.layer_of(entity.kind))
+        self.views[entity] = sprite
+        return sprite
 
     def create_game_objects(self):
-        # เตา (stove)
-        self.pot = self.create_image_object(310, 154, 90, 106, "pot.png")
-        self.pot_icons = []
-        self.pot_contents = []
-
-        self.chopping_board = self.create_image_object(467, 185, 70, 50, "chopping_board.png")
-        self.chopping_board_icons = []
-
-        # จุดเสิร์ฟ (serve)
-        self.serve_station = self.create_image_object(1158, 163, 160, 229, "serve_station.png")
-        self.plate_station = self.create_image_object(1167, 353, 100, 85, "plate_station.png")
-        self.trash_bin = self.create_image_object(1045, 172, 90, 90, "trash_bin.png")
-
-        # โต๊ะ (table)
-        self.create_image_object(150, 500, 1240, 715, "table.png")
+        # station, วัตถุดิบ, โต๊ะ และเชฟตามเลย์เอาต์ของด่าน
+        self.world_size = wdmodel.build_level(self.model, self.level)
+
+    def sync_view(self):
+        """อัปเดต sprite เฉพาะ entity ที่ model บอกว่าเปลี่ยนตั้งแต่ครั้งก่อน
+
+        sprite ของ entity ที่ถูกลบ (หยิบ ทิ้ง เสิร์ฟ หรือ reset ตอนเริ่มเกมใหม่) กลับเข้า pool
+        """
+        removed, dirty = self.model.take_changes()
+        views = self.views
+        self.pool.release_all([views.pop(entity) for entity in removed if entity in views])
+
+        for entity in dirty:
+            sprite = views.get(entity)
+            if sprite is None:
+                sprite = self.create_image_object(entity)
+            else:
+                self.set_sprite(sprite, entity.sprite)
+                self.set_geometry(sprite, entity.x, entity.y, entity.w, entity.h)
+            # ของในมือ: ติด sprite กับเชฟครั้งเดียว หลังจากนั้นเชฟเดินแล้วไปด้วยกันเอง
+            parent = entity.parent
+            if parent is not None and sprite.parent is None:
+                parent_sprite = views.get(parent) or self.create_image_object(parent)
+                self.attach(sprite, parent_sprite, entity.x, entity.y)
 
-        # วัตถุดิบ (ingredients)
-        self.ingredients = []  # ✅ เก็บรายการวัตถุดิบ
+    def resizeEvent(self, event):
+        if self.world_size is None:
+            # ด่านห้องเดียว: เชฟเดินได้ภายในขอบของ widget
+            self.model.resize(self.width(), self.height())
+        self.follow_chef()
+        super().resizeEvent(event)
 
-        tomato = self.create_image_object(920, 477, 80, 80, "tomato.png")
-        lettuce = self.create_image_object(853, 460, 90, 130, "lettuce.png")
-        cucamber = self.create_image_object(980, 475, 90, 80, "cucamber.png")
+    def follow_chef(self):
+        """เลื่อนกล้องให้เชฟอยู่กลางจอ (ไม่เลยขอบโลก) — ด่านห้องเดียวไม่เลื่อน"""
+        if self.world_size is None:
+            return
+        chef = self.model.chef
+        world_w, world_h = self.world_size
+        x = chef.x + chef.w / 2 - self.width() / 2
+        y = chef.y + chef.h / 2 - self.height() / 2
+        self.set_camera(max(0, min(x, world_w - self.width())),
+                        max(0, min(y, world_h - self.height())))
 
-        # ใส่ใน list เพื่อใช้ตรวจชน
-        self.ingredients = [
-            {"name": "tomato", "widget": tomato},
-            {"name": "lettuce", "widget": lettuce},
-            {"name": "cucamber", "widget": cucamber},
-        ]
+    def is_idle(self):
+        return not (self.pressed_keys & MOVE_KEYS)
 
+    def is_throttled(self):
+        window = self.window()
+        return not self.isVisible() or window.isMinimized() or not window.isActiveWindow()
 
     def keyPressEvent(self, event):
         key = event.key()
-        self.pressed_keys.add(key)
-
-        # 🎯 ปุ่ม F = ใช้ทำหลายอย่าง (หยิบ, ใส่จาน, ทิ้ง, รับจาน)
-        if key == QtCore.Qt.Key_F:
-
-            # ----- 1️⃣ กรณีถืออะไรอยู่ -----
-            if self.has_item:
-                # ถ้าอยู่ใกล้ถังขยะ → ทิ้งของ
-                if wdutil.is_near_trash(self):
-                    wdutil.try_throw_item_to_trash(self)
-
-                # ถ้าอยู่ใกล้จาน → ใส่วัตถุดิบลงจาน
-                # ถ้าอยู่ใกล้ plate station → ใส่ลงจานที่ station
-                elif hasattr(self, "plate_station") and wdutil.is_near_object(self.chef, self.plate_station):
-                    wdutil.add_item_to_plate(self, self.current_item)
-                    # ล้างของในมือ
-                    self.has_item = False
-                    self.current_item = None
-                    if getattr(self, "held_icon", None):
-                        self.held_icon.deleteLater()
-                        self.held_icon = None
-
-                elif getattr(self, "dropped_plates", None) and any(
-                    wdutil.is_near_object(self.chef, plate_dict.get("label"))
-                    for plate_dict in self.dropped_plates
-                    if plate_dict.get("label") is not None
-                ):
-                    # หา plate ที่อยู่ใกล้ที่สุดและใส่ของลงไปบนจานที่พื้น
-                    for plate_dict in list(self.dropped_plates):
-                        plate_label = plate_dict.get("label")
-                        if plate_label and wdutil.is_near_object(self.chef, plate_label):
-                            wdutil.add_item_to_dropped_plate(self, plate_dict, self.current_item)
-                            break
-
-                    # ล้างของในมือ
-                    self.has_item = False
-                    self.current_item = None
-                    if getattr(self, "held_icon", None):
-                        self.held_icon.deleteLater()
-                        self.held_icon = None
-
-                # ถ้าเราถือจานอยู่และถือวัตถุดิบด้วย → ใส่ลงในจานที่ถือ
-                elif getattr(self, "has_plate", False):
-                    wdutil.add_item_to_held_plate(self, self.current_item)
-                    # ล้างของในมือ
-                    self.has_item = False
-                    self.current_item = None
-                    if getattr(self, "held_icon", None):
-                        self.held_icon.deleteLater()
-                        self.held_icon = None
-
-                # ถ้าไม่เข้าเงื่อนไขอื่น ๆ → วางของ (drop)
-                else:
-                    wdutil.drop_item(self)
-
-            # ----- 2️⃣ ถ้าไม่มีวัตถุดิบ แต่ถือจานอยู่ -----
-            elif getattr(self, "has_plate", False):
-                # ถ้าอยู่ใกล้ถังขยะ → ทิ้งจาน
-                if wdutil.is_near_trash(self):
-                    wdutil.throw_plate_to_trash(self)
-                # ถ้าอยู่ใกล้จุดเสิร์ฟ → เสิร์ฟจาน
-                elif wdutil.try_serve_plate(self):
-                    # เสิร์ฟเสร็จแล้ว ฟังก์ชันจะจัดการ state ให้
-                    return
-                else:
-                    pass  # ยังไม่วาง (ใช้ปุ่ม G วางแทน)
-
-            # ----- 3️⃣ ถ้าไม่มีของในมือเลย -----
-            else:
-                # พยายามหยิบจานก่อน (เพราะจานมี priority สูงกว่า item)
-                if wdutil.try_pickup_plate(self):
-                    return
-                # ถ้าไม่เจอจาน → พยายามหยิบวัตถุดิบแทน
-                wdutil.try_pick_item(self)
-
-        # 🎯 ปุ่ม G = วางของ/จานบนพื้น
-        elif key == QtCore.Qt.Key_G:
-            if getattr(self, "has_plate", False):
-                wdutil.drop_plate(self)
-            elif self.has_item:
-                wdutil.drop_item(self)
-
-        # 🔪 ปุ่ม Space = ใช้ทำ action เช่น หั่นของ
-        elif key == QtCore.Qt.Key_Space:
-            wdutil.process_space_action(self)
+        if event.isAutoRepeat():
+            return
+        # เวลาที่ใช้ใน handler นี้นับเป็น lag ที่เกมทำให้ Maya (loop.monitor)
+        with self.loop.monitor.measure():
+            # เดินเวลาที่ loop หลับไปก่อน ด้วยสถานะปุ่มเดิม
+            self.loop.wake()
+            self.pressed_keys.add(key)
+
+            # F = ใช้ทำหลายอย่าง (หยิบ, ใส่จาน, ทิ้ง, รับจาน, เสิร์ฟ), G = วางลงพื้น, Space = หั่น
+            # model.resolve() ตัดสินไว้แล้วว่าปุ่มไหนทำอะไร (คำนวณใหม่เฉพาะเมื่อเชฟเดิน/ฉากเปลี่ยน)
+            slot = KEY_SLOTS.get(key)
+            if slot is not None:
+                action, target = self.model.resolve().action(slot)
+                wdutil.dispatch(self, action, target)
+                self.sync_view()
+                self.loop.defer("highlight", self.update_highlight)
+
+            # ปุ่มเดินหรืองานใหม่ (เช่นเริ่มหั่น) เปลี่ยนเวลาปลุก — ให้ loop ตั้งเวลาใหม่
+            self.loop.wake()
 
     def keyReleaseEvent(self, event):
         key = event.key()
+        if event.isAutoRepeat():
+            return
         if key in self.pressed_keys:
             self.pressed_keys.remove(key)
 
+    def focusOutEvent(self, event):
+        # ปล่อยปุ่มที่ค้างไว้ (keyRelease จะไม่มาถ้า focus หลุดไปที่ Maya)
+        self.pressed_keys.clear()
+        super().focusOutEvent(event)
+
     def update_position(self):
+        """เดินหนึ่ง step แล้ววาดทันที (ใช้ใน benchmark/ทดสอบ — ตอนเล่นจริง self.loop เป็นคนเรียก)"""
+        self.simulate(wdmodel.TICK_SECONDS)
+        self.render_frame()
+
+    def simulate(self, dt):
         dx = dy = 0
         if QtCore.Qt.Key_Left in self.pressed_keys:
-            dx -= self.chef_speed
+            dx -= 1
         if QtCore.Qt.Key_Right in self.pressed_keys:
-            dx += self.chef_speed
+            dx += 1
         if QtCore.Qt.Key_Up in self.pressed_keys:
-            dy -= self.chef_speed
+            dy -= 1
         if QtCore.Qt.Key_Down in self.pressed_keys:
-            dy += self.chef_speed
-
-        new_x = max(0, min(self.chef.x() + dx, self.width() - self.chef.width()))
-        new_y = max(0, min(self.chef.y() + dy, self.height() - self.chef.height()))
-        self.chef.move(new_x, new_y)
-
-        if getattr(self, "held_icon", None):
-            icon_x = new_x + (self.chef.width() - self.held_icon.width()) // 2
-            icon_y = new_y - self.held_icon.height() - 5
-            self.held_icon.move(icon_x, icon_y)
-
-        if getattr(self, "has_plate", False) and hasattr(self, "held_plate"):
-            wdutil.update_plate_position(self, self.chef, self.held_plate)
+            dy += 1
+
+        events = self.model.step(dx, dy, dt)
+        if events:
+            wdutil.on_step_events(self, events)
+
+    def render_frame(self):
+        self.sync_view()
+        self.follow_chef()
+        # กรอบไฮไลต์ช้าไปหนึ่งเฟรมได้ — ทำในเวลาที่เหลือของงบเฟรม
+        self.loop.defer("highlight", self.update_highlight)
+
+    def update_highlight(self):
+        """กรอบไฮไลต์รอบของที่ปุ่ม F/Space จะใช้ (อ่านจาก resolve() ที่ cache ไว้)"""
+        target = self.model.resolve().target
+        if target is self._highlight_target:
+            return
+        self._highlight_target = target
+        if target is None:
+            self.set_highlight(None)
+            return
+        self.set_highlight(QtCore.QRect(int(target.x), int(target.y), target.w, target.h))
 
 
 class Overlay(QtWidgets.QWidget):
@@ -379,8 +409,8 @@ class GamePage(QtWidgets.QWidget):
         layout.setContentsMargins(0, 0, 0, 0)
 
         self.bg_label = QtWidgets.QLabel(self)
-        self.bg_label.setScaledContents(True)  # ให้ขยายเต็มพื้นที่ widget
-        self.bg_pixmap = QtGui.QPixmap(f"{SOURCE_PATH}/bg_kitchen.png")
+        # ภาพพื้นหลังถูกย่อให้เต็มพื้นที่ widget ใน resizeEvent
+        self.bg_pixmap = wdassets.get_pixmap("bg_kitchen.png")
         self.bg_label.setPixmap(self.bg_pixmap)
         self.bg_label.lower()
 
@@ -402,26 +432,11 @@ class GamePage(QtWidgets.QWidget):
         self.order_label.setGeometry(10, 10, 400, 40)
         self.order_label.setStyleSheet("font-size: 20px; background-color: white; text-align: center;")
 
-        # Game clock
-        self.remaining_time = 50
-        self.time_label.setText(f"Time: {self.remaining_time}")
-        self.game_clock = QtCore.QTimer(self)
-        self.game_clock.timeout.connect(self._tick_game_clock)
-        self.game_clock.start(1000)
-
-        # Orders: scan available plate combo images
-        try:
-            files = os.listdir(os.path.join(os.path.dirname(__file__), "source_image", "image"))
-            combos = [f[len("plate_"):-4] for f in files if f.startswith("plate_") and f.lower().endswith('.png')]
-        except Exception:
-            combos = []
-        if not combos:
-            combos = ["tomato_chopped", "lettuce_chopped", "cucamber_chopped"]
-
-        import random
-        # maintain a queue of 3 orders
-        self.orders = [random.choice(combos) for _ in range(3)]
-        self._refresh_orders_label()
+        # Game clock (time, score and the 3-order queue live in game_widget.model)
+        # one tick per second of simulated time from the game widget's loop,
+        # which starts in begin_play(), when the page is first shown
+        self.game_widget.loop.second.connect(self._tick_game_clock)
+        self.refresh_hud()
 
 
         # ปุ่ม Pause
@@ -439,8 +454,27 @@ class GamePage(QtWidgets.QWidget):
         self.overlay.quit_btn.clicked.connect(self.back_to_menu)
         
 
+    @property
+    def remaining_time(self):
+        return self.game_widget.model.remaining_time
+
+    @property
+    def orders(self):
+        return self.game_widget.model.order_names()
+
+    def refresh_hud(self):
+        # ตั้งข้อความ label ในเวลาที่เหลือของเฟรม (เรียกซ้ำในเฟรมเดียวกันตั้งครั้งเดียว)
+        self.game_widget.loop.defer("hud", self._apply_hud)
+
+    def _apply_hud(self):
+        model = self.game_widget.model
+        self.score_label.setText(f"Score: {model.score}")
+        self.time_label.setText(f"Time: {model.remaining_time}")
+        self._refresh_orders_label()
+
     def resizeEvent(self, event):
         self.bg_label.setGeometry(0, 0, self.width(), self.height())
+        wdassets.set_label_sprite(self.bg_label, "bg_kitchen")
         self.overlay.setGeometry(0, 0, self.width(), self.height())
         super().resizeEvent(event)
 
@@ -451,17 +485,42 @@ class GamePage(QtWidgets.QWidget):
         except Exception:
             pass
         super().showEvent(event)
+        self.begin_play()
+
+    def hideEvent(self, event):
+        # กลับไปหน้าเมนู: หยุด loop (ย่อหน้าต่างไม่หยุด แค่ tick ห่างลง)
+        if not event.spontaneous():
+            self.pause_play()
+        super().hideEvent(event)
+
+    def begin_play(self):
+        """Start (or resume) the game timers unless the overlay is holding the game."""
+        if self.overlay.isVisibleTo(self):
+            return
+        if self.remaining_time <= 0:
+            self.restart_game()
+            return
+        self.resume_play()
 
-    def show_overlay(self):
-        # pause game timers
+    def pause_play(self):
+        """หยุด game loop (และนาฬิกาเกม) พร้อมงานที่ใช้เวลาทั้งครัว (หั่น ต้ม)"""
         try:
-            self.game_clock.stop()
+            self.game_widget.loop.stop()
         except Exception:
             pass
+        self.game_widget.model.jobs.pause()
+
+    def resume_play(self):
+        """เล่นต่อ — ทุกทางที่เริ่ม loop ใหม่ต้องผ่านที่นี่ เพื่อให้งานที่หยุดไว้เดินต่อด้วย"""
+        self.game_widget.model.jobs.resume()
         try:
-            self.game_widget.timer.stop()
+            self.game_widget.loop.start()
         except Exception:
             pass
+
+    def show_overlay(self):
+        # pause game loop (and with it the game clock) and every timed job in the kitchen
+        self.pause_play()
         # Set overlay to paused mode and show
         try:
             self.overlay.set_paused()
@@ -471,40 +530,20 @@ class GamePage(QtWidgets.QWidget):
 
     def hide_overlay(self):
         self.overlay.hide()
-        # resume game timers
-        try:
-            self.game_clock.start(1000)
-        except Exception:
-            pass
-        try:
-            self.game_widget.timer.start(16)
-        except Exception:
-            pass
+        # resume timed jobs and the game loop
+        self.resume_play()
 
     def _tick_game_clock(self):
-        self.remaining_time -= 1
-        if self.remaining_time < 0:
-            self.remaining_time = 0
-        self.time_label.setText(f"Time: {self.remaining_time}")
-        if self.remaining_time <= 0:
-            # time up -> show overlay and stop timers
-            try:
-                self.game_clock.stop()
-            except Exception:
-                pass
-            try:
-                self.game_widget.timer.stop()
-            except Exception:
-                pass
+        time_up = self.game_widget.model.tick_clock(1)
+        self.game_widget.loop.defer("time", self._refresh_time_label)
+        # เวลาที่เหลือของแต่ละออร์เดอร์เปลี่ยนทุกวินาที
+        self.game_widget.loop.defer("orders", self._refresh_orders_label)
+        if time_up:
+            # time up -> show overlay and stop the loop
+            self.pause_play()
             # show game-over overlay with final score
             try:
-                # parse numeric score from label
-                text = self.score_label.text()
-                score = int(text.split(":")[-1].strip())
-            except Exception:
-                score = 0
-            try:
-                self.overlay.set_game_over(score)
+                self.overlay.set_game_over(self.game_widget.model.score)
             except Exception:
                 pass
             self.overlay.show()
@@ -524,90 +563,18 @@ class GamePage(QtWidgets.QWidget):
 
     def restart_game(self):
         """Reset game state to allow a fresh playthrough."""
-        # reset time and score
-        self.remaining_time = 120
-        self.time_label.setText(f"Time: {self.remaining_time}")
-        self.score_label.setText("Score: 0")
-
-        # clear items from the game widget
+        # reset time, score, orders and every item/plate in the kitchen
+        # (their sprites go back to the game widget's pool in sync_view);
+        # in-flight jobs such as chops are cancelled in one go
         gw = self.game_widget
-        try:
-            for lbl in list(getattr(gw, 'placed_items', [])):
-                try:
-                    lbl.deleteLater()
-                except Exception:
-                    pass
-            gw.placed_items = []
-        except Exception:
-            gw.placed_items = []
-
-        try:
-            for lbl in list(getattr(gw, 'pot_icons', [])):
-                try:
-                    lbl.deleteLater()
-                except Exception:
-                    pass
-            gw.pot_icons = []
-            gw.pot_contents = []
-        except Exception:
-            gw.pot_icons = []
-            gw.pot_contents = []
-
-        try:
-            for lbl in list(getattr(gw, 'chopping_board_icons', [])):
-                try:
-                    lbl.deleteLater()
-                except Exception:
-                    pass
-            gw.chopping_board_icons = []
-        except Exception:
-            gw.chopping_board_icons = []
-
-        try:
-            for pd in list(getattr(gw, 'dropped_plates', [])):
-                try:
-                    lab = pd.get('label')
-                    if lab:
-                        lab.deleteLater()
-                except Exception:
-                    pass
-            gw.dropped_plates = []
-        except Exception:
-            gw.dropped_plates = []
-
-        try:
-            if getattr(gw, 'held_plate', None):
-                gw.held_plate.deleteLater()
-            gw.held_plate = None
-        except Exception:
-            gw.held_plate = None
-
-        try:
-            if getattr(gw, 'held_icon', None):
-                gw.held_icon.deleteLater()
-            gw.held_icon = None
-        except Exception:
-            gw.held_icon = None
-
-        gw.has_item = False
-        gw.current_item = None
-        gw.has_plate = False
-        gw.plate_items = []
-        gw.station_plate_items = []
-
-        # regenerate orders
-        try:
-            files = os.listdir(os.path.join(os.path.dirname(__file__), "source_image", "image"))
-            combos = [f[len("plate_"):-4] for f in files if f.startswith("plate_") and f.lower().endswith('.png')]
-        except Exception:
-            combos = []
-        if not combos:
-            combos = ["tomato_chopped", "lettuce_chopped", "cucamber_chopped"]
-        import random
-        self.orders = [random.choice(combos) for _ in range(3)]
-        self._refresh_orders_label()
-
-        # hide overlay and restart timers
+        gw.model.reset(remaining_time=120)
+        gw.sync_view()
+        gw.loop.monitor.reset()
+        gw.follow_chef()
+        gw.update_highlight()
+        self.refresh_hud()
+
+        # hide overlay and restart the loop with a fresh game clock
         try:
             self.overlay.set_paused()
         except Exception:
@@ -617,48 +584,150 @@ class GamePage(QtWidgets.QWidget):
         except Exception:
             pass
         try:
-            self.game_clock.start(1000)
-        except Exception:
-            pass
-        try:
-            self.game_widget.timer.start(16)
+            gw.loop.reset_clock()
         except Exception:
             pass
+        self.resume_play()
+
+    def _refresh_time_label(self):
+        self.time_label.setText(f"Time: {self.remaining_time}")
 
     def _refresh_orders_label(self):
-        # display orders nicely
-        disp = " | ".join(self.orders)
+        # display orders nicely, each with the seconds left before it expires
+        disp = " | ".join(f"{name} {left:.0f}s" for name, left in self.game_widget.model.order_status())
         self.order_label.setText(f"Orders: {disp}")
 
     def back_to_menu(self):
         self.overlay.hide()
         self.stacked_widget.setCurrentIndex(0)
 
+class LazyStackedWidget(QtWidgets.QStackedWidget):
+    """QStackedWidget ที่สร้างแต่ละหน้า (และโหลดภาพของหน้านั้น) ตอนถูกแสดงครั้งแรก"""
+    def __init__(self, factories, parent=None):
+        super().__init__(parent)
+        self._factories = list(factories)
+        self._built = set()
+        self.build_ms = {}  # index -> เวลาที่ใช้สร้างหน้า
+        for _ in self._factories:
+            self.addWidget(QtWidgets.QWidget())  # placeholder
+
+    def page(self, index):
+        if index not in self._built:
+            t0 = time.perf_counter()
+            page = self._factories[index](self)
+            placeholder = self.widget(index)
+            self.insertWidget(index, page)
+            self.removeWidget(placeholder)
+            placeholder.deleteLater()
+            self._built.add(index)
+            self.build_ms[index] = (time.perf_counter() - t0) * 1000.0
+            print(f"🧱 สร้างหน้า {type(page).__name__}: {self.build_ms[index]:.1f} ms")
+        return self.widget(index)
+
+    def is_built(self, index):
+        return index in self._built
+
+    def setCurrentIndex(self, index):
+        self.page(index)
+        super().setCurrentIndex(index)
+
+
 class WellDoneGame(QtWidgets.QMainWindow):
     def __init__(self, parent=None):
+        self._t_start = time.perf_counter()
         super().__init__(parent)
         self.setWindowTitle("Well Done! 🧑‍🍳")
         self.resize(1200, 675)
+        self.time_to_first_frame = None  # ms จากเริ่มสร้างหน้าต่างถึงเฟรมแรก
+        self.source_stamp = SOURCE_STAMP
 
-        self.stacked = QtWidgets.QStackedWidget()
-        self.page1 = GameMenu(self.stacked)
-        self.page2 = HowToPlayPage(self.stacked)
-        self.page3 = GamePage(self.stacked)
-
-        self.stacked.addWidget(self.page1)
-        self.stacked.addWidget(self.page2)
-        self.stacked.addWidget(self.page3)
+        # หน้าต่าง ๆ ถูกสร้างตอนแสดงครั้งแรก (เมนูแสดงทันที)
+        self.stacked = LazyStackedWidget([GameMenu, HowToPlayPage, GamePage])
         self.setCentralWidget(self.stacked)
+        self.stacked.setCurrentIndex(0)
+
+    @property
+    def page1(self):
+        return self.stacked.page(0)
+
+    @property
+    def page2(self):
+        return self.stacked.page(1)
+
+    @property
+    def page3(self):
+        return self.stacked.page(2)
+
+    def paintEvent(self, event):
+        if self.time_to_first_frame is None:
+            self.time_to_first_frame = (time.perf_counter() - self._t_start) * 1000.0
+            print(f"⏱️ time-to-first-frame: {self.time_to_first_frame:.1f} ms")
+        super().paintEvent(event)
+
+
+def maya_main_window():
+    """หน้าต่างหลักของ Maya — import maya เฉพาะตอนเปิดเกมใน Maya เท่านั้น"""
+    import maya.OpenMayaUI as omui
+    return wrapInstance(int(omui.MQtUtil.mainWindow()), QtWidgets.QWidget)
+
+
+def reload_util():
+    """สลับฟังก์ชันใน wellDoneGameUtil เป็นเวอร์ชันล่าสุดโดยไม่แตะหน้าต่าง
+
+    importlib.reload แก้โมดูลเดิมในที่ ทุกจุดที่เรียก wdutil.xxx จึงได้โค้ดใหม่ทันที
+    ส่วนสถานะเกมอยู่บน widget และ cache ภาพอยู่ใน wellDoneGameAssets ซึ่งไม่ถูก reload
+    """
+    t0 = time.perf_counter()
+    importlib.reload(wdutil)
+    ms = (time.perf_counter() - t0) * 1000.0
+    print(f"♻️ reload wellDoneGameUtil: {ms:.1f} ms")
+    return ms
+
+
+def reload_game_modules():
+    """reload recipes -> model -> loop -> render ตามลำดับ import
+
+    โมดูลพวกนี้มีคลาสของสถานะเกม (Kitchen, GameLoop, Sprite ...) ออบเจกต์เดิมบนหน้าต่าง
+    ยังเป็นคลาสเก่า run() จึงสร้างหน้าต่าง (และ GamePage.model) ใหม่ตามหลังเสมอ
+    """
+    t0 = time.perf_counter()
+    for module in _game_modules():
+        importlib.reload(module)
+    ms = (time.perf_counter() - t0) * 1000.0
+    print(f"♻️ reload game modules: {ms:.1f} ms")
+    return ms
 
 
 def run():
+    """Maya entry point (shelf button). Outside Maya use: python -m wellDoneGameLauncher
+
+    ถ้าไฟล์ UI และโมดูลสถานะเกม (recipes/model/loop/render) ไม่ได้ถูกแก้ จะ reload แค่
+    wellDoneGameUtil แล้วใช้หน้าต่างเดิมต่อ (สถานะเกมและภาพที่ถอดรหัสไว้ยังอยู่)
+    ถ้าไฟล์ไหนในนั้นเปลี่ยน จะ reload ตามลำดับ import แล้วสร้างหน้าต่างใหม่
+    """
     global ui
+    if _source_stamp() != SOURCE_STAMP:
+        # a game module or this module changed since it was imported: reload them in import
+        # order, then rebuild the window (and its Kitchen) with the new classes
+        reload_game_modules()
+        module = importlib.reload(sys.modules[__name__])
+        return module.run()
+
+    window = globals().get("ui")
+    if window is not None and isValid(window) and getattr(window, "source_stamp", None) == SOURCE_STAMP:
+        reload_util()
+        window.show()
+        window.raise_()
+        window.activateWindow()
+        return window
+
     try:
         ui.close()
         ui.deleteLater()
     except:
         pass
 
-    ptr = wrapInstance(int(omui.MQtUtil.mainWindow()), QtWidgets.QWidget)
-    ui = WellDoneGame(parent=ptr)
-    ui.show()
\ No newline at end of file
+    reload_util()
+    ui = WellDoneGame(parent=maya_main_window())
+    ui.show()
+    return ui
\ No newline at end of file